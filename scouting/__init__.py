@@ -6,6 +6,7 @@ __all__ = [
     "grid_queries",
     "grid_ingest",
     "normalize",
+    "frame",
     "features",
     "matchups",
     "scenarios",
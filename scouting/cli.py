@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import os
+from dataclasses import asdict
 from typing import Any, Dict, List, Optional
 
 from .grid_ingest import (
@@ -104,7 +105,7 @@ def main() -> None:
     games = normalize_records(records, meta.team_id, meta.opponent_id)
 
     if args.save_normalized:
-        _write_json(args.save_normalized, [g.__dict__ for g in games])
+        _write_json(args.save_normalized, [asdict(g) for g in games])
 
     report = build_report(games, meta)
 
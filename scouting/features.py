@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import heapq
 import math
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from .normalize import GameRecord, PlayerPerf
 
 
+@lru_cache(maxsize=4096)
 def _parse_time(ts: str) -> Optional[datetime]:
+    # Pure function of the timestamp string; games in a series share one,
+    # so parsing is memoized. The age itself is recomputed on every call.
     if not ts:
         return None
     try:
@@ -28,11 +33,18 @@ def _recency_weight(ts: str, half_life_days: float = 30.0) -> float:
     return math.exp(-math.log(2) * age_days / half_life_days)
 
 
-def _entropy(counts: Dict[str, float]) -> float:
-    total = sum(counts.values())
+def _entropy(counts: Mapping[str, float]) -> float:
+    # Normalized Shannon entropy; int counts work as-is.
+    return _entropy_counts(counts.values())
+
+
+def _entropy_counts(counts: Iterable[float]) -> float:
+    # Same as _entropy, on bare counts (e.g. Counter.values()) with no keys.
+    counts = list(counts)
+    total = sum(counts)
     if total <= 0:
         return 0.0
-    probs = [v / total for v in counts.values() if v > 0]
+    probs = [v / total for v in counts if v > 0]
     if not probs:
         return 0.0
     ent = -sum(p * math.log(p, 2) for p in probs)
@@ -110,7 +122,7 @@ def compute_roster_stability(games: List[GameRecord], side: str) -> Dict[str, An
         for pid in seen:
             player_games[pid] += 1
         total += 1
-    top5 = sum(v for _, v in sorted(player_games.items(), key=lambda x: x[1], reverse=True)[:5])
+    top5 = sum(heapq.nlargest(5, player_games.values()))
     stability = (top5 / total) if total else 0.0
     return {
         "unique_players": len(player_games),
@@ -119,7 +131,12 @@ def compute_roster_stability(games: List[GameRecord], side: str) -> Dict[str, An
     }
 
 
-def compute_style_triangle(games: List[GameRecord]) -> Dict[str, Any]:
+def compute_style_triangle(
+    games: List[GameRecord],
+    roster_stability: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    # roster_stability: optional compute_roster_stability results keyed by side,
+    # reused instead of re-walking the games when the caller already has them.
     def _style_for(side: str) -> Dict[str, float]:
         kills = 0
         deaths = 0
@@ -144,8 +161,9 @@ def compute_style_triangle(games: List[GameRecord]) -> Dict[str, Any]:
         winrate = (wins / total) if total else 0.0
         winrate_std = float((sum((w - winrate) ** 2 for w in win_list) / len(win_list)) ** 0.5) if win_list else 0.0
         control = (1.0 / (1.0 + (deaths / total))) + (1.0 / (1.0 + winrate_std)) if total else 0.0
-        flex = _entropy({k: float(v) for k, v in champ_counts.items()})
-        roster = compute_roster_stability(games, side).get("top5_share", 0.0)
+        flex = _entropy(champ_counts)
+        stability = (roster_stability or {}).get(side) or compute_roster_stability(games, side)
+        roster = stability.get("top5_share", 0.0)
         flexibility = flex * (1.0 + roster)
         return {
             "aggression_raw": aggression,
@@ -183,6 +201,53 @@ def compute_style_triangle(games: List[GameRecord]) -> Dict[str, Any]:
     }
 
 
+def _cos(a: List[float], b: List[float]) -> float:
+    num = sum(x * y for x, y in zip(a, b))
+    da = math.sqrt(sum(x * x for x in a))
+    db = math.sqrt(sum(y * y for y in b))
+    if da == 0 or db == 0:
+        return 0.0
+    return num / (da * db)
+
+
+def _nearest_neighbors(X: List[List[float]]) -> List[Tuple[float, Optional[int]]]:
+    """
+    For each row, the most cosine-similar other row as (similarity, index);
+    the lowest index wins ties, and (-1.0, None) means there is no other row.
+    """
+    n = len(X)
+    if n < 2:
+        return [(-1.0, None)] * n
+    try:
+        import numpy as np  # ships with scikit-learn
+    except ImportError:
+        out: List[Tuple[float, Optional[int]]] = []
+        for i in range(n):
+            best: Tuple[float, Optional[int]] = (-1.0, None)
+            for j in range(n):
+                if i == j:
+                    continue
+                s = _cos(X[i], X[j])
+                if s > best[0]:
+                    best = (s, j)
+            out.append(best)
+        return out
+
+    # One Gram matrix instead of n^2 Python dot products; BLAS runs it
+    # outside the GIL. The features are counts and 0/1 flags, so dots and
+    # norms are exact and match the scalar formula bit for bit.
+    A = np.asarray(X, dtype=float)
+    norms = np.sqrt((A * A).sum(axis=1))
+    zero = norms == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        S = (A @ A.T) / np.outer(norms, norms)
+    S[zero, :] = 0.0
+    S[:, zero] = 0.0
+    np.fill_diagonal(S, -np.inf)
+    best_idx = S.argmax(axis=1)
+    return [(float(S[i, j]), int(j)) for i, j in enumerate(best_idx)]
+
+
 def compute_draft_dna_summary(
     games: List[GameRecord],
     side: str,
@@ -197,7 +262,7 @@ def compute_draft_dna_summary(
         for p in state.players:
             if p.character:
                 champ_counts[p.character] += 1
-    champ_vocab = [c for c, _ in sorted(champ_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]]
+    champ_vocab = [c for c, _ in heapq.nlargest(top_n, champ_counts.items(), key=lambda x: x[1])]
     champ_index = {c: i for i, c in enumerate(champ_vocab)}
 
     rows: List[Dict[str, Any]] = []
@@ -243,25 +308,9 @@ def compute_draft_dna_summary(
         vec[-1] = row["tempo"]
         X.append(vec)
 
-    # cosine similarity
-    def _cos(a: List[float], b: List[float]) -> float:
-        num = sum(x * y for x, y in zip(a, b))
-        da = math.sqrt(sum(x * x for x in a))
-        db = math.sqrt(sum(y * y for y in b))
-        if da == 0 or db == 0:
-            return 0.0
-        return num / (da * db)
-
     sims = []
     neighbors: List[Dict[str, Any]] = []
-    for i in range(len(X)):
-        best = (-1.0, None)
-        for j in range(len(X)):
-            if i == j:
-                continue
-            s = _cos(X[i], X[j])
-            if s > best[0]:
-                best = (s, j)
+    for i, best in enumerate(_nearest_neighbors(X)):
         sims.append(best[0])
         if best[1] is not None:
             neighbors.append(
@@ -313,7 +362,7 @@ def compute_signature_cluster_cards(
     if not rows:
         return {"games": 0, "k": 0, "primary_cluster": None, "clusters": []}
 
-    champ_vocab = [c for c, _ in sorted(champ_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]]
+    champ_vocab = [c for c, _ in heapq.nlargest(top_n, champ_counts.items(), key=lambda x: x[1])]
     champ_index = {c: i for i, c in enumerate(champ_vocab)}
     role_keys = sorted({r for row in rows for r in row["roles"].keys() if r})
     role_index = {r: i for i, r in enumerate(role_keys)}
@@ -441,9 +490,14 @@ def compute_player_similarity(
 
 
 def compute_counterfactual_bans(
-    games: List[GameRecord], side: str, min_games: int = 3
+    games: List[GameRecord],
+    side: str,
+    min_games: int = 3,
+    champ_stats: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
-    champ_stats = compute_champion_winrates(games, side, min_games=min_games)
+    # champ_stats: optional compute_champion_winrates(games, side, min_games) result
+    if champ_stats is None:
+        champ_stats = compute_champion_winrates(games, side, min_games=min_games)
     out: List[Dict[str, Any]] = []
     # For each team (here: only one side), pick top champs by games
     if len(champ_stats) < 2:
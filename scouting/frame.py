@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional
+
+from .normalize import GameRecord
+
+
+@dataclass
+class OpponentFrame:
+    """
+    Column-wise projection of the opponent side of a list of games.
+
+    Per-game columns are indexed by game; player columns are flattened
+    across games and ``offsets[i]:offsets[i + 1]`` selects game ``i``.
+    """
+    offsets: List[int]
+    series_id: List[str]
+    game_number: List[int]
+    start_time: List[str]
+    won: List[bool]
+    lost: List[bool]
+    kills: List[int]
+    deaths: List[int]
+    our_picks: List[Dict[str, str]]
+    player_id: List[str]
+    name: List[Optional[str]]
+    role: List[Optional[str]]
+    character: List[Optional[str]]
+    player_kills: List[int]
+    player_deaths: List[int]
+
+    def __len__(self) -> int:
+        return len(self.won)
+
+    def players(self, i: int) -> range:
+        """Player-column indices belonging to game ``i``."""
+        return range(self.offsets[i], self.offsets[i + 1])
+
+    @cached_property
+    def time_order(self) -> List[int]:
+        """Game indices stably sorted by start time; computed once per frame."""
+        return sorted(range(len(self.won)), key=self.start_time.__getitem__)
+
+
+def build_opponent_frame(games: List[GameRecord]) -> OpponentFrame:
+    """Walk the game records once and project them into an OpponentFrame."""
+    frame = OpponentFrame(
+        offsets=[0], series_id=[], game_number=[], start_time=[],
+        won=[], lost=[], kills=[], deaths=[], our_picks=[],
+        player_id=[], name=[], role=[], character=[],
+        player_kills=[], player_deaths=[],
+    )
+    for g in games:
+        opp = g.opponent
+        frame.series_id.append(g.series_id)
+        frame.game_number.append(g.game_number)
+        frame.start_time.append(g.start_time)
+        frame.won.append(opp.won is True)
+        frame.lost.append(opp.won is False)
+        frame.kills.append(opp.kills)
+        frame.deaths.append(opp.deaths)
+        frame.our_picks.append({p.role: p.character for p in g.team.players if p.role and p.character})
+        for p in opp.players:
+            frame.player_id.append(p.player_id)
+            frame.name.append(p.name)
+            frame.role.append(p.role)
+            frame.character.append(p.character)
+            frame.player_kills.append(p.kills)
+            frame.player_deaths.append(p.deaths)
+        frame.offsets.append(len(frame.player_id))
+    return frame
@@ -17,6 +17,9 @@ class GridGraphQLClient:
     api_key: str
     timeout_s: int = 30
     cache: Optional[CacheConfig] = None
+    # time.monotonic() value after which no further requests are sent, so a
+    # caller that has given up on a fetch doesn't leave it retrying
+    deadline: Optional[float] = None
 
     def __post_init__(self) -> None:
         self.session = requests.Session()
@@ -36,6 +39,17 @@ class GridGraphQLClient:
         digest = hashlib.sha1(key_src.encode("utf-8")).hexdigest()
         return self.cache.base_dir / f"{digest}.json"
 
+    def _remaining_s(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def _sleep(self, seconds: float) -> None:
+        remaining = self._remaining_s()
+        if remaining is not None:
+            seconds = min(seconds, max(0.0, remaining))
+        time.sleep(seconds)
+
     def query(
         self,
         url: str,
@@ -54,10 +68,14 @@ class GridGraphQLClient:
 
         last_err: Optional[Exception] = None
         for attempt in range(retries):
+            remaining = self._remaining_s()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"GRID request deadline passed. Last error: {last_err}")
+            timeout = self.timeout_s if remaining is None else min(self.timeout_s, remaining)
             try:
-                resp = self.session.post(url, json=payload, timeout=self.timeout_s)
+                resp = self.session.post(url, json=payload, timeout=timeout)
                 if resp.status_code in (429, 500, 502, 503, 504):
-                    time.sleep(backoff_s * (attempt + 1))
+                    self._sleep(backoff_s * (attempt + 1))
                     continue
 
                 resp.raise_for_status()
@@ -72,7 +90,7 @@ class GridGraphQLClient:
                         for e in errors
                     )
                     if is_rate_limit and attempt < retries - 1:
-                        time.sleep(backoff_s * (attempt + 2))  # Longer backoff for rate limits
+                        self._sleep(backoff_s * (attempt + 2))  # Longer backoff for rate limits
                         continue
                     raise RuntimeError("GraphQL errors: " + json.dumps(errors, indent=2))
                 if "data" not in body:
@@ -86,7 +104,7 @@ class GridGraphQLClient:
                 return data
             except Exception as exc:
                 last_err = exc
-                time.sleep(backoff_s * (attempt + 1))
+                self._sleep(backoff_s * (attempt + 1))
 
         raise RuntimeError(f"Failed after {retries} attempts. Last error: {last_err}")
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -230,8 +231,10 @@ def fetch_series_for_matchup(
     team_id_override: Optional[str] = None,
     opponent_id_override: Optional[str] = None,
     debug: bool = False,
+    timeout_s: Optional[float] = None,
 ) -> Tuple[List[RawSeriesRecord], FetchMeta]:
-    client = GridGraphQLClient(api_key)
+    deadline = time.monotonic() + timeout_s if timeout_s is not None else None
+    client = GridGraphQLClient(api_key, deadline=deadline)
 
     title_id = resolve_title_id(client, title)
     if debug:
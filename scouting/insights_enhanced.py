@@ -7,12 +7,15 @@ using terminology that professional LoL players understand.
 
 from __future__ import annotations
 
-import math
+from bisect import bisect_right
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import combinations, groupby
 from typing import Any, Dict, List, Optional, Tuple
 
+from .frame import OpponentFrame, build_opponent_frame
 from .normalize import GameRecord, PlayerPerf
 
 
@@ -50,6 +53,41 @@ def _winrate_label(wr: float) -> str:
         return "weak"
 
 
+# Canonical role order used by the draft decision tree
+_ROLE_ORDER = ("top", "jg", "mid", "bot", "sup")
+_ROLE_INDEX = {role: idx for idx, role in enumerate(_ROLE_ORDER)}
+
+# Winrate bands shared by the decision tree and kill participation web:
+# below 45%, 45-60%, and 60% or better.
+_WINRATE_BANDS = (0.45, 0.6)
+_PICK_THREAT_LABELS = ("low", "medium", "high")
+_RESPONSE_LABELS = ("avoid", "viable", "strong_counter")
+_EDGE_LABELS = (("weak", "anti_synergy"), ("moderate", "neutral"), ("strong", "synergy"))
+
+
+def _winrate_band(wr: float) -> int:
+    """Index of the winrate band (0, 1 or 2) for the lookup tables above."""
+    return bisect_right(_WINRATE_BANDS, wr)
+
+
+# Game tempo from average kills + deaths per game: 14 or fewer is slow,
+# 20+ aggressive, 28+ bloody.
+_TEMPO_BANDS = (14.0, 20.0, 28.0)
+_TEMPO_LABELS = (
+    ("slow", "They play for scaling"),
+    ("standard", "Normal game flow"),
+    ("aggressive", "They like to fight"),
+    ("bloody", "Expect constant fighting"),
+)
+
+
+def _tempo_band(total_action: float) -> int:
+    """Index into _TEMPO_LABELS; slow keeps its upper edge, the rest their lower one."""
+    if total_action <= _TEMPO_BANDS[0]:
+        return 0
+    return bisect_right(_TEMPO_BANDS, total_action)
+
+
 def _pool_depth_label(unique_champs: int, total_games: int) -> str:
     """Classify champion pool depth."""
     if total_games == 0:
@@ -143,6 +181,7 @@ def generate_executive_summary(
     scenarios: List[Any],
     randomness: Dict[str, Any],
     opponent_name: str,
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Generate a high-level executive summary for coaches/players.
@@ -158,15 +197,18 @@ def generate_executive_summary(
             "confidence": "low",
         }
 
+    if frame is None:
+        frame = build_opponent_frame(games)
+
     # Basic stats
-    total_games = len(games)
-    wins = sum(1 for g in games if g.opponent.won is True)
+    total_games = len(frame)
+    wins = sum(frame.won)
     winrate = wins / total_games if total_games else 0
 
     # Recent form (last 30 days)
-    recent_games = [g for g in games if _days_ago(g.start_time) <= 30]
-    recent_wins = sum(1 for g in recent_games if g.opponent.won is True)
-    recent_wr = recent_wins / len(recent_games) if recent_games else winrate
+    recent_results = [won for won, ts in zip(frame.won, frame.start_time) if _days_ago(ts) <= 30]
+    recent_wins = sum(recent_results)
+    recent_wr = recent_wins / len(recent_results) if recent_results else winrate
 
     # Determine predictability
     rand_score = randomness.get("score", 50)
@@ -913,6 +955,7 @@ def generate_the_story(
     side_analysis: Dict[str, Any],
     cheese_picks: List[Dict[str, Any]],
     opponent_name: str,
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Generate a narrative scouting report like a sports analyst would write.
@@ -924,8 +967,11 @@ def generate_the_story(
             "tldr": "Insufficient data to analyze.",
         }
 
-    total_games = len(games)
-    wins = sum(1 for g in games if g.opponent.won is True)
+    if frame is None:
+        frame = build_opponent_frame(games)
+
+    total_games = len(frame)
+    wins = sum(frame.won)
     winrate = wins / total_games
 
     # Opening paragraph - who are they?
@@ -1229,19 +1275,24 @@ def analyze_side_preference(
 
 def analyze_series_momentum(
     games: List[GameRecord],
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Analyze how the team performs across a series (game 1 vs game 2-5).
     Do they adapt? Do they tilt after losses?
     """
-    # Group games by series
-    series_map: Dict[str, List[GameRecord]] = defaultdict(list)
-    for g in games:
-        series_map[g.series_id].append(g)
+    if frame is None:
+        frame = build_opponent_frame(games)
 
-    # Sort each series by game number
+    # Opponent result per game: True (won), False (lost) or None (unknown)
+    results = [True if won else False if lost else None for won, lost in zip(frame.won, frame.lost)]
+
+    # Group game results by series, ordered by game number
+    series_map: Dict[str, List[int]] = defaultdict(list)
+    for i, sid in enumerate(frame.series_id):
+        series_map[sid].append(i)
     for sid in series_map:
-        series_map[sid].sort(key=lambda g: g.game_number)
+        series_map[sid].sort(key=lambda i: frame.game_number[i])
 
     # Game 1 performance
     game1_results = []
@@ -1260,38 +1311,38 @@ def analyze_series_momentum(
     series_chokes = 0     # Won game 1, lost series
     total_multi_game_series = 0
 
-    for sid, series_games in series_map.items():
-        if len(series_games) < 1:
+    for sid, series_indices in series_map.items():
+        if len(series_indices) < 1:
             continue
+        series_results = [results[i] for i in series_indices]
 
         # Game 1 stats
-        g1 = series_games[0]
-        game1_results.append(g1.opponent.won is True)
+        game1_results.append(series_results[0] is True)
 
         # Later games
-        for g in series_games[1:]:
-            later_games_results.append(g.opponent.won is True)
+        for won in series_results[1:]:
+            later_games_results.append(won is True)
 
         # Track momentum within series
         prev_won = None
-        for g in series_games:
+        for won in series_results:
             if prev_won is not None:
                 if prev_won is False:  # Previous game was a loss
                     after_loss_games += 1
-                    if g.opponent.won is True:
+                    if won is True:
                         after_loss_wins += 1
                 elif prev_won is True:  # Previous game was a win
                     after_win_games += 1
-                    if g.opponent.won is True:
+                    if won is True:
                         after_win_wins += 1
-            prev_won = g.opponent.won
+            prev_won = won
 
         # Comebacks / chokes (need 2+ game series with outcome info)
-        if len(series_games) >= 2:
-            first_game_won = series_games[0].opponent.won
+        if len(series_results) >= 2:
+            first_game_won = series_results[0]
             # Determine series winner (simplified: who won more games)
-            wins_in_series = sum(1 for g in series_games if g.opponent.won is True)
-            losses_in_series = sum(1 for g in series_games if g.opponent.won is False)
+            wins_in_series = sum(1 for won in series_results if won is True)
+            losses_in_series = sum(1 for won in series_results if won is False)
 
             if wins_in_series > 0 or losses_in_series > 0:
                 total_multi_game_series += 1
@@ -1394,38 +1445,39 @@ def detect_cheese_picks(
     These are surprise picks the opponent might pull out.
     """
     # Track champion stats per player
-    player_champ_stats: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"games": 0, "wins": 0})
-    )
-    player_total_games: Dict[str, int] = defaultdict(int)
+    player_champ_games: Dict[str, Counter[str]] = defaultdict(Counter)
+    player_champ_wins: Dict[str, Counter[str]] = defaultdict(Counter)
+    player_total_games: Counter[str] = Counter()
     player_names: Dict[str, str] = {}
     player_roles: Dict[str, str] = {}
 
     for g in games:
+        opp_won = g.opponent.won is True
         for p in g.opponent.players:
-            if not p.player_id or not p.character:
+            pid = p.player_id
+            if not pid or not p.character:
                 continue
 
-            player_total_games[p.player_id] += 1
-            player_champ_stats[p.player_id][p.character]["games"] += 1
-            if g.opponent.won is True:
-                player_champ_stats[p.player_id][p.character]["wins"] += 1
+            player_total_games[pid] += 1
+            player_champ_games[pid][p.character] += 1
+            if opp_won:
+                player_champ_wins[pid][p.character] += 1
 
             if p.name:
-                player_names[p.player_id] = p.name
+                player_names[pid] = p.name
             if p.role:
-                player_roles[p.player_id] = p.role
+                player_roles[pid] = p.role
 
     cheese_picks = []
 
-    for pid, champ_data in player_champ_stats.items():
+    for pid, champ_games in player_champ_games.items():
         total_games = player_total_games[pid]
         if total_games < 5:  # Need enough games to identify patterns
             continue
 
-        for champ, stats in champ_data.items():
-            games_count = stats["games"]
-            wins = stats["wins"]
+        champ_wins = player_champ_wins[pid]
+        for champ, games_count in champ_games.items():
+            wins = champ_wins[champ]
             pick_rate = games_count / total_games
             winrate = wins / games_count if games_count > 0 else 0
 
@@ -1579,10 +1631,102 @@ def generate_one_thing_to_remember(
 # IF THEY PICK X - DECISION TREE FOR DRAFT
 # =============================================================================
 
+@dataclass
+class PickResponses:
+    """
+    Flat tuple-keyed counters of opponent picks and our answers to them.
+
+    Pick keys are (role index, their_champ); response keys add our_champ.
+    Roles outside _ROLE_ORDER are dropped on ingest.
+    """
+    pick_games: Counter[Tuple[int, str]]
+    pick_wins: Counter[Tuple[int, str]]
+    response_games: Counter[Tuple[int, str, str]]
+    response_wins: Counter[Tuple[int, str, str]]
+
+
+def build_pick_responses(frame: OpponentFrame) -> PickResponses:
+    """Count what the opponent picked per role and what we answered with."""
+    counts = PickResponses(Counter(), Counter(), Counter(), Counter())
+    roles = frame.role
+    characters = frame.character
+
+    # For each game, track what they picked and what worked against it
+    for i, opp_won in enumerate(frame.won):
+        opp_picks = {
+            roles[j]: characters[j]
+            for j in frame.players(i)
+            if roles[j] in _ROLE_INDEX and characters[j]
+        }
+        our_picks = frame.our_picks[i]
+
+        # Record matchups, and what we picked into them
+        picks = [(_ROLE_INDEX[role], their_champ) for role, their_champ in opp_picks.items()]
+        responses = [
+            (ri, their_champ, our_picks[_ROLE_ORDER[ri]])
+            for ri, their_champ in picks
+            if our_picks.get(_ROLE_ORDER[ri])
+        ]
+        counts.pick_games.update(picks)
+        counts.response_games.update(responses)
+        if opp_won:
+            counts.pick_wins.update(picks)
+        else:  # We won
+            counts.response_wins.update(responses)
+
+    return counts
+
+
+@dataclass(slots=True)
+class _TreeNode:
+    id: str
+    type: str
+    label: str
+    data: Dict[str, Any]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "type": self.type, "label": self.label, "data": self.data}
+
+
+@dataclass(slots=True)
+class _TreeEdge:
+    source: str
+    target: str
+    type: str
+    label: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        edge = {"source": self.source, "target": self.target, "type": self.type}
+        if self.label is not None:
+            edge["label"] = self.label
+        return edge
+
+
+def _summarize_pick_responses(ranked: List[Tuple[int, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Best and worst answers into an opponent pick.
+
+    ``ranked`` holds (first_seen, response) pairs already ordered by
+    (winrate, games) descending; winrate ties go to the response seen first.
+    """
+    if not ranked:
+        return {"ranked": [], "best": None, "worst": None}
+
+    top_wr = ranked[0][1]["winrate"]
+    low_wr = ranked[-1][1]["winrate"]
+    return {
+        "ranked": [response for _, response in ranked],
+        "best": min((r for r in ranked if r[1]["winrate"] == top_wr), key=lambda r: r[0])[1],
+        "worst": min((r for r in ranked if r[1]["winrate"] == low_wr), key=lambda r: r[0])[1],
+    }
+
+
 def generate_pick_decision_tree(
     games: List[GameRecord],
     per_player: Dict[str, Any],
     counters: Dict[str, Any],
+    frame: Optional[OpponentFrame] = None,
+    pick_responses: Optional[PickResponses] = None,
 ) -> Dict[str, Any]:
     """
     Generate a decision tree structure for draft:
@@ -1590,86 +1734,95 @@ def generate_pick_decision_tree(
 
     Returns data structured for frontend visualization as a flowchart.
     """
-    # Build pick-response data from games
-    pick_responses: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(
-        lambda: defaultdict(lambda: {"games": 0, "wins": 0, "our_picks": defaultdict(lambda: {"games": 0, "wins": 0})})
-    )
-
-    # For each game, track what they picked and what worked against it
-    for g in games:
-        opp_picks = {}
-        our_picks = {}
-
-        for p in g.opponent.players:
-            if p.role and p.character:
-                opp_picks[p.role] = p.character
-
-        for p in g.team.players:
-            if p.role and p.character:
-                our_picks[p.role] = p.character
-
-        opp_won = g.opponent.won is True
+    if pick_responses is None:
+        if frame is None:
+            frame = build_opponent_frame(games)
+        pick_responses = build_pick_responses(frame)
+    pick_games = pick_responses.pick_games
+    pick_wins = pick_responses.pick_wins
+    response_games = pick_responses.response_games
+    response_wins = pick_responses.response_wins
+
+    picks_by_role: List[List[Tuple[str, int]]] = [[] for _ in _ROLE_ORDER]
+    for (ri, their_champ), count in pick_games.items():
+        picks_by_role[ri].append((their_champ, count))
+
+    # Rank each role's opponent picks once; the flowchart (top 4) and the
+    # quick reference (top 3) both read from the same ranking and the same
+    # per-pick response summary.
+    ranked_by_role = [
+        sorted(role_picks, key=lambda x: x[1], reverse=True)[:4]
+        for role_picks in picks_by_role
+    ]
 
-        # Record matchups
-        for role, their_champ in opp_picks.items():
-            pick_responses[role][their_champ]["games"] += 1
-            if opp_won:
-                pick_responses[role][their_champ]["wins"] += 1
+    # Rank the responses to every pick that made the cut in a single sort:
+    # grouped by pick, then by (winrate, games) descending, with ties kept
+    # in first-seen order.
+    kept = {(ri, their_champ) for ri, ranked in enumerate(ranked_by_role) for their_champ, _ in ranked}
+    response_rows = []
+    for seq, ((ri, their_champ, our_champ), count) in enumerate(response_games.items()):
+        if (ri, their_champ) in kept:
+            winrate = response_wins[(ri, their_champ, our_champ)] / count
+            response_rows.append((ri, their_champ, -winrate, -count, seq, our_champ))
+    response_rows.sort()
+
+    ranked_responses: Dict[Tuple[int, str], List[Tuple[int, Dict[str, Any]]]] = {}
+    for pick, rows in groupby(response_rows, key=lambda row: (row[0], row[1])):
+        ranked_responses[pick] = [
+            (seq, {"champion": our_champ, "games": -neg_count, "winrate": -neg_winrate})
+            for _, _, neg_winrate, neg_count, seq, our_champ in rows
+        ]
 
-            # What did we pick into it?
-            our_champ = our_picks.get(role)
-            if our_champ:
-                pick_responses[role][their_champ]["our_picks"][our_champ]["games"] += 1
-                if not opp_won:  # We won
-                    pick_responses[role][their_champ]["our_picks"][our_champ]["wins"] += 1
+    role_sorted: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+    response_summary: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for ri, ranked in enumerate(ranked_by_role):
+        if not ranked:
+            continue
+        role = _ROLE_ORDER[ri]
+        role_sorted[role] = []
+        for their_champ, count in ranked:
+            role_sorted[role].append((their_champ, {
+                "games": count,
+                "wins": pick_wins[(ri, their_champ)],
+            }))
+            if count >= 2:
+                response_summary[(role, their_champ)] = _summarize_pick_responses(
+                    ranked_responses.get((ri, their_champ), [])
+                )
 
-    # Build decision tree nodes
-    nodes = []
-    edges = []
-    node_id = 0
+    # Build decision tree nodes; a node's id is its index in `nodes`
+    nodes: List[_TreeNode] = []
+    edges: List[_TreeEdge] = []
 
     # Create root node
-    root_id = f"node_{node_id}"
-    nodes.append({
-        "id": root_id,
-        "type": "root",
-        "label": "Draft Start",
-        "data": {},
-    })
-    node_id += 1
+    root_id = f"node_{len(nodes)}"
+    nodes.append(_TreeNode(
+        id=root_id,
+        type="root",
+        label="Draft Start",
+        data={},
+    ))
 
     # For each role, create champion nodes
-    role_order = ["top", "jg", "mid", "bot", "sup"]
     role_nodes = {}
 
-    for role in role_order:
-        role_data = pick_responses.get(role, {})
-        if not role_data:
-            continue
-
+    for role, sorted_picks in role_sorted.items():
         # Create role grouping node
-        role_node_id = f"node_{node_id}"
-        nodes.append({
-            "id": role_node_id,
-            "type": "role",
-            "label": role.upper(),
-            "data": {"role": role},
-        })
-        edges.append({
-            "source": root_id,
-            "target": role_node_id,
-            "type": "role_branch",
-        })
+        role_node_id = f"node_{len(nodes)}"
+        nodes.append(_TreeNode(
+            id=role_node_id,
+            type="role",
+            label=role.upper(),
+            data={"role": role},
+        ))
+        edges.append(_TreeEdge(
+            source=root_id,
+            target=role_node_id,
+            type="role_branch",
+        ))
         role_nodes[role] = role_node_id
-        node_id += 1
 
         # Top picks for this role
-        sorted_picks = sorted(
-            role_data.items(),
-            key=lambda x: x[1]["games"],
-            reverse=True
-        )[:4]  # Top 4 picks per role
-
         for their_champ, data in sorted_picks:
             if data["games"] < 2:
                 continue
@@ -1677,134 +1830,107 @@ def generate_pick_decision_tree(
             their_wr = data["wins"] / data["games"]
 
             # Create "if they pick X" node
-            pick_node_id = f"node_{node_id}"
-            nodes.append({
-                "id": pick_node_id,
-                "type": "opponent_pick",
-                "label": their_champ,
-                "data": {
+            pick_node_id = f"node_{len(nodes)}"
+            nodes.append(_TreeNode(
+                id=pick_node_id,
+                type="opponent_pick",
+                label=their_champ,
+                data={
                     "champion": their_champ,
                     "role": role,
                     "games": data["games"],
                     "their_winrate": their_wr,
-                    "threat_level": "high" if their_wr >= 0.6 else "medium" if their_wr >= 0.45 else "low",
+                    "threat_level": _PICK_THREAT_LABELS[_winrate_band(their_wr)],
                 },
-            })
-            edges.append({
-                "source": role_node_id,
-                "target": pick_node_id,
-                "type": "if_pick",
-                "label": f"If {their_champ}",
-            })
-            node_id += 1
+            ))
+            edges.append(_TreeEdge(
+                source=role_node_id,
+                target=pick_node_id,
+                type="if_pick",
+                label=f"If {their_champ}",
+            ))
 
-            # Find best responses
-            our_responses = []
-            for our_champ, response_data in data["our_picks"].items():
-                if response_data["games"] >= 1:
-                    our_wr = response_data["wins"] / response_data["games"]
-                    our_responses.append({
-                        "champion": our_champ,
-                        "games": response_data["games"],
-                        "winrate": our_wr,
-                    })
-
-            our_responses.sort(key=lambda x: (x["winrate"], x["games"]), reverse=True)
+            # Best responses, already ranked by (winrate, games)
+            our_responses = response_summary[(role, their_champ)]["ranked"]
 
             # Create response nodes (top 2)
             for i, response in enumerate(our_responses[:2]):
-                response_node_id = f"node_{node_id}"
-
-                if response["winrate"] >= 0.6:
-                    recommendation = "strong_counter"
-                    rec_label = "Strong Answer"
-                elif response["winrate"] >= 0.45:
-                    recommendation = "viable"
-                    rec_label = "Viable"
-                else:
-                    recommendation = "avoid"
-                    rec_label = "Avoid"
-
-                nodes.append({
-                    "id": response_node_id,
-                    "type": "response",
-                    "label": response["champion"],
-                    "data": {
+                response_node_id = f"node_{len(nodes)}"
+                recommendation = _RESPONSE_LABELS[_winrate_band(response["winrate"])]
+
+                nodes.append(_TreeNode(
+                    id=response_node_id,
+                    type="response",
+                    label=response["champion"],
+                    data={
                         "champion": response["champion"],
                         "games": response["games"],
                         "winrate": response["winrate"],
                         "recommendation": recommendation,
                         "vs": their_champ,
                     },
-                })
-                edges.append({
-                    "source": pick_node_id,
-                    "target": response_node_id,
-                    "type": "response",
-                    "label": f"{response['winrate']:.0%} WR" if response["games"] >= 2 else "Limited data",
-                })
-                node_id += 1
+                ))
+                edges.append(_TreeEdge(
+                    source=pick_node_id,
+                    target=response_node_id,
+                    type="response",
+                    label=f"{response['winrate']:.0%} WR" if response["games"] >= 2 else "Limited data",
+                ))
 
             # Add avoid node if we have data on what didn't work
             bad_responses = [r for r in our_responses if r["winrate"] < 0.4 and r["games"] >= 2]
             if bad_responses:
                 worst = bad_responses[-1]
-                avoid_node_id = f"node_{node_id}"
-                nodes.append({
-                    "id": avoid_node_id,
-                    "type": "avoid",
-                    "label": f"Avoid: {worst['champion']}",
-                    "data": {
+                avoid_node_id = f"node_{len(nodes)}"
+                nodes.append(_TreeNode(
+                    id=avoid_node_id,
+                    type="avoid",
+                    label=f"Avoid: {worst['champion']}",
+                    data={
                         "champion": worst["champion"],
                         "games": worst["games"],
                         "winrate": worst["winrate"],
                         "reason": f"Only {worst['winrate']:.0%} WR vs their {their_champ}",
                     },
-                })
-                edges.append({
-                    "source": pick_node_id,
-                    "target": avoid_node_id,
-                    "type": "avoid",
-                    "label": "Don't pick",
-                })
-                node_id += 1
+                ))
+                edges.append(_TreeEdge(
+                    source=pick_node_id,
+                    target=avoid_node_id,
+                    type="avoid",
+                    label="Don't pick",
+                ))
 
     # Create summary for quick reference
     quick_reference = []
-    for role in role_order:
-        role_data = pick_responses.get(role, {})
-        if not role_data:
-            continue
-
+    for role, sorted_picks in role_sorted.items():
         role_summary = {"role": role, "matchups": []}
 
-        sorted_picks = sorted(role_data.items(), key=lambda x: x[1]["games"], reverse=True)[:3]
-
-        for their_champ, data in sorted_picks:
+        for their_champ, data in sorted_picks[:3]:
             if data["games"] < 2:
                 continue
 
+            summary = response_summary[(role, their_champ)]
+            best = summary["best"]
+            worst = summary["worst"]
+
             best_response = None
             best_wr = 0
+            if best and best["winrate"] > 0:
+                best_response = best["champion"]
+                best_wr = best["winrate"]
+
             avoid_pick = None
-            avoid_wr = 1
-
-            for our_champ, response_data in data["our_picks"].items():
-                if response_data["games"] >= 1:
-                    wr = response_data["wins"] / response_data["games"]
-                    if wr > best_wr:
-                        best_wr = wr
-                        best_response = our_champ
-                    if wr < avoid_wr:
-                        avoid_wr = wr
-                        avoid_pick = our_champ
+            avoid_wr = None
+            if worst and worst["winrate"] < 0.4:
+                avoid_pick = worst["champion"]
+                avoid_wr = worst["winrate"]
 
             role_summary["matchups"].append({
                 "if_they_pick": their_champ,
                 "consider": best_response,
                 "consider_wr": best_wr,
-                "avoid": avoid_pick if avoid_wr < 0.4 else None,
-                "avoid_wr": avoid_wr if avoid_wr < 0.4 else None,
+                "avoid": avoid_pick,
+                "avoid_wr": avoid_wr,
             })
 
         if role_summary["matchups"]:
@@ -1812,8 +1938,8 @@ def generate_pick_decision_tree(
 
     return {
         "flowchart": {
-            "nodes": nodes,
-            "edges": edges,
+            "nodes": [node.as_dict() for node in nodes],
+            "edges": [edge.as_dict() for edge in edges],
         },
         "quick_reference": quick_reference,
         "total_nodes": len(nodes),
@@ -1828,6 +1954,7 @@ def generate_pick_decision_tree(
 def generate_kill_participation_web(
     games: List[GameRecord],
     per_player: Dict[str, Any],
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Generate a network graph showing which players enable each other.
@@ -1840,67 +1967,72 @@ def generate_kill_participation_web(
 
     player_names: Dict[str, str] = {}
     player_roles: Dict[str, str] = {}
-    player_total_kills: Dict[str, int] = defaultdict(int)
-    player_total_deaths: Dict[str, int] = defaultdict(int)
-    player_games: Dict[str, int] = defaultdict(int)
+    player_total_kills: Counter[str] = Counter()
+    player_total_deaths: Counter[str] = Counter()
+    player_games: Counter[str] = Counter()
 
     # Track which players appear in the same games (proxy for kill participation)
     # Since we don't have per-kill data, we use game-level stats
-    co_occurrence: Dict[tuple, Dict[str, int]] = defaultdict(lambda: {"games": 0, "wins": 0})
+    pair_games: Counter[Tuple[str, str]] = Counter()
+    pair_wins: Counter[Tuple[str, str]] = Counter()
+
+    # Key synergy pairs
+    synergy_pairs = [
+        ("jg", "mid"),   # Jungle-Mid synergy
+        ("bot", "sup"),  # Bot lane synergy
+        ("jg", "top"),   # Jungle-Top synergy
+        ("jg", "bot"),   # Jungle-Bot synergy
+        ("mid", "sup"),  # Roaming support
+    ]
 
-    # Role-based synergy tracking
-    role_synergy: Dict[tuple, Dict[str, Any]] = defaultdict(
-        lambda: {"games": 0, "wins": 0, "total_kills": 0}
-    )
+    # Role-based synergy tallies, indexed by position in synergy_pairs
+    synergy_games = [0] * len(synergy_pairs)
+    synergy_wins = [0] * len(synergy_pairs)
+    synergy_kills = [0] * len(synergy_pairs)
+    synergy_first_game = [0] * len(synergy_pairs)
 
-    for g in games:
+    if frame is None:
+        frame = build_opponent_frame(games)
+
+    for i, team_won in enumerate(frame.won):
         game_players = []
-        team_won = g.opponent.won is True
-        team_kills = g.opponent.kills
+        role_players = {}
+        team_kills = frame.kills[i]
 
-        for p in g.opponent.players:
-            if not p.player_id:
+        for j in frame.players(i):
+            pid = frame.player_id[j]
+            if not pid:
                 continue
 
-            game_players.append(p.player_id)
-            player_total_kills[p.player_id] += p.kills
-            player_total_deaths[p.player_id] += p.deaths
-            player_games[p.player_id] += 1
-
-            if p.name:
-                player_names[p.player_id] = p.name
-            if p.role:
-                player_roles[p.player_id] = p.role
-
-        # Track co-occurrence (players in the same game)
-        for i in range(len(game_players)):
-            for j in range(i + 1, len(game_players)):
-                pair = tuple(sorted([game_players[i], game_players[j]]))
-                co_occurrence[pair]["games"] += 1
-                if team_won:
-                    co_occurrence[pair]["wins"] += 1
+            game_players.append(pid)
+            player_total_kills[pid] += frame.player_kills[j]
+            player_total_deaths[pid] += frame.player_deaths[j]
+            player_games[pid] += 1
+
+            name = frame.name[j]
+            role = frame.role[j]
+            if name:
+                player_names[pid] = name
+            if role:
+                player_roles[pid] = role
+                role_players[role] = pid
+
+        # Track co-occurrence (players in the same game). Pairs are keyed
+        # sorted but counted in encounter order, which fixes edge order and
+        # the key-duo tie-break.
+        pairs = [(a, b) if a <= b else (b, a) for a, b in combinations(game_players, 2)]
+        pair_games.update(pairs)
+        if team_won:
+            pair_wins.update(pairs)
 
         # Track role synergies
-        role_players = {}
-        for p in g.opponent.players:
-            if p.role and p.player_id:
-                role_players[p.role] = p.player_id
-
-        # Key synergy pairs
-        synergy_pairs = [
-            ("jg", "mid"),   # Jungle-Mid synergy
-            ("bot", "sup"),  # Bot lane synergy
-            ("jg", "top"),   # Jungle-Top synergy
-            ("jg", "bot"),   # Jungle-Bot synergy
-            ("mid", "sup"),  # Roaming support
-        ]
-
-        for r1, r2 in synergy_pairs:
+        for k, (r1, r2) in enumerate(synergy_pairs):
             if r1 in role_players and r2 in role_players:
-                role_synergy[(r1, r2)]["games"] += 1
-                if team_won:
-                    role_synergy[(r1, r2)]["wins"] += 1
-                role_synergy[(r1, r2)]["total_kills"] += team_kills
+                if not synergy_games[k]:
+                    synergy_first_game[k] = i
+                synergy_games[k] += 1
+                synergy_wins[k] += team_won
+                synergy_kills[k] += team_kills
 
     # Build network graph
     nodes = []
@@ -1941,23 +2073,23 @@ def generate_kill_participation_web(
             "size": node_size,
         })
 
-    # Create edges based on co-occurrence and synergy
-    for (p1, p2), data in co_occurrence.items():
-        if data["games"] < 2:
+    # Create edges based on co-occurrence and synergy, tracking the key duo
+    # (best winrate over 3+ games together) on the way
+    best_duo = None
+    best_duo_wr = 0
+    for pair, pair_count in pair_games.items():
+        if pair_count < 2:
             continue
 
-        winrate = data["wins"] / data["games"]
+        p1, p2 = pair
+        wins = pair_wins[pair]
+        winrate = wins / pair_count
+        if pair_count >= 3 and winrate > best_duo_wr:
+            best_duo_wr = winrate
+            best_duo = pair
 
         # Determine edge strength
-        if winrate >= 0.6:
-            strength = "strong"
-            edge_type = "synergy"
-        elif winrate >= 0.45:
-            strength = "moderate"
-            edge_type = "neutral"
-        else:
-            strength = "weak"
-            edge_type = "anti_synergy"
+        strength, edge_type = _EDGE_LABELS[_winrate_band(winrate)]
 
         r1 = player_roles.get(p1, "")
         r2 = player_roles.get(p2, "")
@@ -1966,8 +2098,8 @@ def generate_kill_participation_web(
             "source": p1,
             "target": p2,
             "data": {
-                "games": data["games"],
-                "wins": data["wins"],
+                "games": pair_count,
+                "wins": wins,
                 "winrate": winrate,
                 "roles": f"{r1}-{r2}",
             },
@@ -1976,62 +2108,66 @@ def generate_kill_participation_web(
         })
 
     # Identify the playmaker (highest kill participation)
-    playmaker = None
-    playmaker_score = 0
-    for pid in player_games:
-        score = player_total_kills[pid] / player_games[pid] if player_games[pid] > 0 else 0
-        if score > playmaker_score:
-            playmaker_score = score
-            playmaker = pid
-
-    # Identify the enabler (support/jungle with high team winrate)
-    enabler = None
+    playmaker = max(
+        player_games,
+        key=lambda pid: player_total_kills[pid] / player_games[pid],
+        default=None,
+    )
+    if playmaker and player_total_kills[playmaker] == 0:
+        playmaker = None
+
+    # Identify the enabler (support/jungle with low deaths); the last
+    # qualifying player wins
+    enabler_candidates = [
+        pid for pid in player_games
+        if player_roles.get(pid, "") in ("sup", "jg")
+        and player_games[pid] >= 3
+        and player_total_deaths[pid] / player_games[pid] < 3
+    ]
+    enabler = enabler_candidates[-1] if enabler_candidates else None
     enabler_note = ""
-    for pid in player_games:
-        role = player_roles.get(pid, "")
-        if role in ("sup", "jg"):
-            games_count = player_games[pid]
-            # Calculate winrate when this player is in the game
-            wins = sum(1 for pair, data in co_occurrence.items()
-                       if pid in pair for _ in range(data["wins"]))
-            # Simplified: use deaths as inverse proxy for enabling
-            deaths = player_total_deaths[pid]
-            deaths_per_game = deaths / games_count if games_count > 0 else 0
-            if deaths_per_game < 3 and games_count >= 3:
-                enabler = pid
-                enabler_note = f"Low deaths ({deaths_per_game:.1f}/game) while enabling team"
+    if enabler:
+        deaths_per_game = player_total_deaths[enabler] / player_games[enabler]
+        enabler_note = f"Low deaths ({deaths_per_game:.1f}/game) while enabling team"
+
+    # Resolve display names/roles once for the insights and the payload
+    playmaker_name = player_names.get(playmaker, "Unknown") if playmaker else None
+    playmaker_role = player_roles.get(playmaker, "") if playmaker else None
+    enabler_name = player_names.get(enabler, "Unknown") if enabler else None
+    enabler_role = player_roles.get(enabler, "") if enabler else None
 
     # Generate insights
     insights = []
 
     if playmaker:
-        name = player_names.get(playmaker, "Unknown")
-        role = player_roles.get(playmaker, "")
         kpg = player_total_kills[playmaker] / player_games[playmaker]
         insights.append({
             "type": "playmaker",
-            "player": name,
-            "role": role,
-            "insight": f"{name} is the primary playmaker ({kpg:.1f} kills/game)",
+            "player": playmaker_name,
+            "role": playmaker_role,
+            "insight": f"{playmaker_name} is the primary playmaker ({kpg:.1f} kills/game)",
             "action": "Neutralize this player to shut down their offense",
         })
 
     if enabler:
-        name = player_names.get(enabler, "Unknown")
-        role = player_roles.get(enabler, "")
         insights.append({
             "type": "enabler",
-            "player": name,
-            "role": role,
-            "insight": f"{name} is the key enabler - {enabler_note}",
+            "player": enabler_name,
+            "role": enabler_role,
+            "insight": f"{enabler_name} is the key enabler - {enabler_note}",
             "action": "Disrupt their vision and roaming to break team synergy",
         })
 
-    # Role synergy insights
-    for (r1, r2), data in role_synergy.items():
-        if data["games"] >= 3:
-            winrate = data["wins"] / data["games"]
-            avg_kills = data["total_kills"] / data["games"]
+    # Role synergy insights, in the order each pairing first showed up
+    seen_synergies = sorted(
+        (k for k in range(len(synergy_pairs)) if synergy_games[k]),
+        key=lambda k: (synergy_first_game[k], k),
+    )
+    for k in seen_synergies:
+        r1, r2 = synergy_pairs[k]
+        if synergy_games[k] >= 3:
+            winrate = synergy_wins[k] / synergy_games[k]
+            avg_kills = synergy_kills[k] / synergy_games[k]
             if winrate >= 0.65:
                 insights.append({
                     "type": "synergy",
@@ -2048,17 +2184,8 @@ def generate_kill_participation_web(
                 })
 
     # Key duo identification
-    best_duo = None
-    best_duo_wr = 0
-    for (p1, p2), data in co_occurrence.items():
-        if data["games"] >= 3:
-            wr = data["wins"] / data["games"]
-            if wr > best_duo_wr:
-                best_duo_wr = wr
-                best_duo = (p1, p2, data)
-
     if best_duo and best_duo_wr >= 0.6:
-        p1, p2, data = best_duo
+        p1, p2 = best_duo
         n1 = player_names.get(p1, "Unknown")
         n2 = player_names.get(p2, "Unknown")
         r1 = player_roles.get(p1, "")
@@ -2077,13 +2204,13 @@ def generate_kill_participation_web(
         },
         "playmaker": {
             "player_id": playmaker,
-            "player_name": player_names.get(playmaker, "Unknown") if playmaker else None,
-            "role": player_roles.get(playmaker, "") if playmaker else None,
+            "player_name": playmaker_name,
+            "role": playmaker_role,
         },
         "enabler": {
             "player_id": enabler,
-            "player_name": player_names.get(enabler, "Unknown") if enabler else None,
-            "role": player_roles.get(enabler, "") if enabler else None,
+            "player_name": enabler_name,
+            "role": enabler_role,
         },
         "insights": insights,
         "visualization_notes": {
@@ -2102,6 +2229,7 @@ def generate_game_script(
     games: List[GameRecord],
     scenarios: List[Dict[str, Any]],
     series_momentum: Dict[str, Any],
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Predict what will happen during the game based on historical patterns.
@@ -2116,28 +2244,19 @@ def generate_game_script(
             "summary": "Insufficient data to predict game flow.",
         }
 
-    total_games = len(games)
-    wins = sum(1 for g in games if g.opponent.won is True)
-    winrate = wins / total_games
+    if frame is None:
+        frame = build_opponent_frame(games)
+
+    total_games = len(frame)
+    winrate = sum(frame.won) / total_games
 
     # Analyze kill patterns to determine tempo
-    avg_kills = sum(g.opponent.kills for g in games) / total_games
-    avg_deaths = sum(g.opponent.deaths for g in games) / total_games
+    avg_kills = sum(frame.kills) / total_games
+    avg_deaths = sum(frame.deaths) / total_games
     total_action = avg_kills + avg_deaths
 
     # Determine game tempo
-    if total_action >= 28:
-        tempo = "bloody"
-        tempo_note = "Expect constant fighting"
-    elif total_action >= 20:
-        tempo = "aggressive"
-        tempo_note = "They like to fight"
-    elif total_action <= 14:
-        tempo = "slow"
-        tempo_note = "They play for scaling"
-    else:
-        tempo = "standard"
-        tempo_note = "Normal game flow"
+    tempo, tempo_note = _TEMPO_LABELS[_tempo_band(total_action)]
 
     # Determine primary style from scenarios
     primary_style = "standard"
@@ -2152,60 +2271,24 @@ def generate_game_script(
     timeline.append({
         "phase": "champ_select",
         "time": "Draft",
-        "prediction": _get_draft_prediction(games, scenarios),
+        "prediction": _get_draft_prediction(scenarios),
         "confidence": "high" if total_games >= 10 else "medium",
         "action": "Watch for their priority picks in first rotation",
     })
 
-    # Early Game (0-5 min)
-    early_prediction = _predict_early_game(games, tempo, primary_style)
-    timeline.append({
-        "phase": "early_game",
-        "time": "0-5 min",
-        "prediction": early_prediction["text"],
-        "events": early_prediction["events"],
-        "confidence": early_prediction["confidence"],
-        "action": early_prediction["action"],
-    })
-
-    # Early-Mid (5-10 min)
-    early_mid_prediction = _predict_early_mid_game(games, tempo, primary_style)
-    timeline.append({
-        "phase": "early_mid",
-        "time": "5-10 min",
-        "prediction": early_mid_prediction["text"],
-        "events": early_mid_prediction["events"],
-        "confidence": early_mid_prediction["confidence"],
-        "action": early_mid_prediction["action"],
-    })
-
-    # Mid Game (10-20 min)
-    mid_prediction = _predict_mid_game(games, tempo, primary_style, winrate)
-    timeline.append({
-        "phase": "mid_game",
-        "time": "10-20 min",
-        "prediction": mid_prediction["text"],
-        "events": mid_prediction["events"],
-        "confidence": mid_prediction["confidence"],
-        "action": mid_prediction["action"],
-    })
-
-    # Late Game (20+ min)
-    late_prediction = _predict_late_game(games, tempo, primary_style, winrate)
-    timeline.append({
-        "phase": "late_game",
-        "time": "20+ min",
-        "prediction": late_prediction["text"],
-        "events": late_prediction["events"],
-        "confidence": late_prediction["confidence"],
-        "action": late_prediction["action"],
-    })
+    # Early game through late game. The phase predictions depend only on
+    # tempo, style and whether they win half their games, so they are built
+    # once per combination; each report gets its own copies.
+    timeline.extend(
+        {**phase, "events": [dict(e) for e in phase["events"]]}
+        for phase in _phase_timeline(tempo, primary_style, winrate >= 0.5)
+    )
 
     # Critical moments
-    critical_moments = _identify_critical_moments(games, tempo, series_momentum)
+    critical_moments = _identify_critical_moments(tempo, series_momentum)
 
     # Win condition prediction
-    win_condition = _predict_win_condition(games, scenarios, tempo)
+    win_condition = _predict_win_condition(scenarios, tempo)
 
     # Generate summary
     summary_parts = []
@@ -2235,7 +2318,7 @@ def generate_game_script(
     }
 
 
-def _get_draft_prediction(games: List[GameRecord], scenarios: List[Dict[str, Any]]) -> str:
+def _get_draft_prediction(scenarios: List[Dict[str, Any]]) -> str:
     """Predict their draft approach."""
     if not scenarios:
         return "Standard draft expected"
@@ -2252,8 +2335,29 @@ def _get_draft_prediction(games: List[GameRecord], scenarios: List[Dict[str, Any
         return f"Varied drafts - could go {style} or adapt based on bans"
 
 
+@lru_cache(maxsize=64)
+def _phase_timeline(tempo: str, style: str, winning: bool) -> Tuple[Dict[str, Any], ...]:
+    """Timeline entries from early game to late game. Callers must copy before mutating."""
+    phases = (
+        ("early_game", "0-5 min", _predict_early_game(tempo, style)),
+        ("early_mid", "5-10 min", _predict_early_mid_game(tempo, style)),
+        ("mid_game", "10-20 min", _predict_mid_game(tempo, style, winning)),
+        ("late_game", "20+ min", _predict_late_game(tempo, style)),
+    )
+    return tuple(
+        {
+            "phase": phase,
+            "time": time,
+            "prediction": prediction["text"],
+            "events": prediction["events"],
+            "confidence": prediction["confidence"],
+            "action": prediction["action"],
+        }
+        for phase, time, prediction in phases
+    )
+
+
 def _predict_early_game(
-    games: List[GameRecord],
     tempo: str,
     style: str,
 ) -> Dict[str, Any]:
@@ -2299,7 +2403,6 @@ def _predict_early_game(
 
 
 def _predict_early_mid_game(
-    games: List[GameRecord],
     tempo: str,
     style: str,
 ) -> Dict[str, Any]:
@@ -2342,15 +2445,14 @@ def _predict_early_mid_game(
 
 
 def _predict_mid_game(
-    games: List[GameRecord],
     tempo: str,
     style: str,
-    winrate: float,
+    winning: bool,
 ) -> Dict[str, Any]:
     """Predict mid game (10-20 min)."""
     events = []
 
-    if style == "early-game" and winrate >= 0.5:
+    if style == "early-game" and winning:
         events.append({
             "event": "Snowball attempt",
             "probability": 0.7,
@@ -2399,10 +2501,8 @@ def _predict_mid_game(
 
 
 def _predict_late_game(
-    games: List[GameRecord],
     tempo: str,
     style: str,
-    winrate: float,
 ) -> Dict[str, Any]:
     """Predict late game (20+ min)."""
     events = []
@@ -2446,7 +2546,6 @@ def _predict_late_game(
 
 
 def _identify_critical_moments(
-    games: List[GameRecord],
     tempo: str,
     series_momentum: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
@@ -2489,7 +2588,6 @@ def _identify_critical_moments(
 
 
 def _predict_win_condition(
-    games: List[GameRecord],
     scenarios: List[Dict[str, Any]],
     tempo: str,
 ) -> Dict[str, Any]:
@@ -2527,13 +2625,21 @@ def generate_enhanced_insights(
     counters: Dict[str, Any],
     randomness: Dict[str, Any],
     opponent_name: str,
+    frame: Optional[OpponentFrame] = None,
 ) -> Dict[str, Any]:
     """
     Generate all enhanced insights for the scouting report.
     """
+    # Project the games once (unless the caller already did); analyzers read
+    # columns from it, and the pick/answer counts are shared by any draft
+    # analytics
+    if frame is None:
+        frame = build_opponent_frame(games)
+    pick_responses = build_pick_responses(frame)
+
     # Generate executive summary
     executive_summary = generate_executive_summary(
-        games, per_player, scenarios, randomness, opponent_name
+        games, per_player, scenarios, randomness, opponent_name, frame=frame
     )
 
     # Enhance player cards
@@ -2563,7 +2669,7 @@ def generate_enhanced_insights(
     side_analysis = analyze_side_preference(games, per_player)
 
     # Series Momentum / Mental Edge
-    series_momentum = analyze_series_momentum(games)
+    series_momentum = analyze_series_momentum(games, frame=frame)
 
     # Cheese Detector - Pocket Picks
     cheese_picks = detect_cheese_picks(games)
@@ -2574,7 +2680,9 @@ def generate_enhanced_insights(
     )
 
     # If They Pick X Decision Tree (for flowchart visualization)
-    pick_decision_tree = generate_pick_decision_tree(games, per_player, counters)
+    pick_decision_tree = generate_pick_decision_tree(
+        games, per_player, counters, frame=frame, pick_responses=pick_responses
+    )
 
     # The Story - Narrative Scouting Report
     the_story = generate_the_story(
@@ -2585,13 +2693,14 @@ def generate_enhanced_insights(
         side_analysis=side_analysis,
         cheese_picks=cheese_picks,
         opponent_name=opponent_name,
+        frame=frame,
     )
 
     # Kill Participation Web - Who enables who
-    kill_web = generate_kill_participation_web(games, enhanced_players)
+    kill_web = generate_kill_participation_web(games, enhanced_players, frame=frame)
 
     # Game Script Prediction - Minute by minute
-    game_script = generate_game_script(games, enhanced_scenarios, series_momentum)
+    game_script = generate_game_script(games, enhanced_scenarios, series_momentum, frame=frame)
 
     return {
         "executive_summary": executive_summary,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -8,7 +8,7 @@ from .features import _recency_weight
 from .normalize import GameRecord, PlayerPerf
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchupStats:
     games: int = 0
     wins: int = 0
@@ -20,50 +20,57 @@ class MatchupStats:
         return min(1.0, self.games / 20.0) if self.games else 0.0
 
 
-def _index_by_role(players: List[PlayerPerf]) -> Dict[str, PlayerPerf]:
-    out: Dict[str, PlayerPerf] = {}
+def _first_player_by_role(players: List[PlayerPerf]) -> Dict[str, PlayerPerf]:
+    # First player seen per role among those with both role and character
+    by_role: Dict[str, PlayerPerf] = {}
     for p in players:
-        if p.role and p.character:
-            if p.role not in out:
-                out[p.role] = p
-    return out
+        if p.role and p.character and p.role not in by_role:
+            by_role[p.role] = p
+    return by_role
 
 
 def build_matchup_table(games: List[GameRecord]) -> Dict[Tuple[str, str, str], MatchupStats]:
-    table: Dict[Tuple[str, str, str], MatchupStats] = defaultdict(MatchupStats)
+    games_by_key: Counter[Tuple[str, str, str]] = Counter()
+    wins_by_key: Counter[Tuple[str, str, str]] = Counter()
 
     for g in games:
-        team_by_role = _index_by_role(g.team.players)
-        opp_by_role = _index_by_role(g.opponent.players)
-        for role, our_player in team_by_role.items():
-            their_player = opp_by_role.get(role)
-            if not their_player:
+        opp_by_role = _first_player_by_role(g.opponent.players)
+        won = g.team.won is True
+        for role, ours in _first_player_by_role(g.team.players).items():
+            theirs = opp_by_role.get(role)
+            if theirs is None:
                 continue
-            key = (role, our_player.character or "", their_player.character or "")
-            if not key[1] or not key[2]:
-                continue
-            stats = table[key]
-            stats.games += 1
-            if g.team.won is True:
-                stats.wins += 1
-    return table
+            key = (role, ours.character, theirs.character)
+            games_by_key[key] += 1
+            if won:
+                wins_by_key[key] += 1
+
+    # Materialize stats only for matchups that were actually played
+    return {
+        key: MatchupStats(games=count, wins=wins_by_key[key])
+        for key, count in games_by_key.items()
+    }
 
 
 def compute_our_pick_pools(games: List[GameRecord]) -> Dict[str, Dict[str, float]]:
-    pools: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    pools: Dict[str, Dict[str, float]] = {}
     for g in games:
         w = _recency_weight(g.start_time)
         for p in g.team.players:
-            if p.player_id and p.character:
-                pools[p.player_id][p.character] += w
+            pid, champ = p.player_id, p.character
+            if pid and champ:
+                picks = pools.get(pid)
+                if picks is None:
+                    picks = pools[pid] = {}
+                picks[champ] = picks.get(champ, 0.0) + w
     return pools
 
 
 def _flatten_pick_rates(pools: Dict[str, Dict[str, float]]) -> Dict[str, float]:
-    flat: Dict[str, float] = defaultdict(float)
+    flat: Dict[str, float] = {}
     for picks in pools.values():
         for champ, w in picks.items():
-            flat[champ] += w
+            flat[champ] = flat.get(champ, 0.0) + w
     return flat
 
 
@@ -80,8 +87,19 @@ def suggest_counters(
 
     role_counters: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
-    # Build a global pool if per-player pools are absent
+    # Build a global pool if per-player pools are absent. Score every played
+    # matchup once and group it under the opponent pick it answers; the pool
+    # position rides along so score ties keep pool order.
     global_pool = _flatten_pick_rates(our_pools)
+    pool_rank = {champ: idx for idx, champ in enumerate(global_pool)}
+    answers: Dict[Tuple[str, str], List[Tuple[int, str, float, float, int]]] = defaultdict(list)
+    for (role, our_champ, their_champ), stats in matchup_table.items():
+        rank = pool_rank.get(our_champ)
+        if rank is None:
+            continue
+        answers[(role, their_champ)].append(
+            (rank, our_champ, stats.posterior_winrate(), stats.confidence(), stats.games)
+        )
 
     for opp in opponent_players.values():
         role = opp.get("role")
@@ -92,30 +110,23 @@ def suggest_counters(
             their_champ = pick.get("character")
             if not their_champ:
                 continue
-            candidates = []
-            for our_champ, weight in global_pool.items():
-                key = (role, our_champ, their_champ)
-                stats = matchup_table.get(key)
-                if not stats:
-                    continue
-                winrate = stats.posterior_winrate()
-                confidence = stats.confidence()
-                score = winrate * confidence * (weight or 0.0)
-                candidates.append(
+            scored = [
+                (winrate * confidence * (global_pool[our_champ] or 0.0), rank, our_champ, winrate, confidence, samples)
+                for rank, our_champ, winrate, confidence, samples in answers.get((role, their_champ), ())
+            ]
+            scored.sort(key=lambda c: (-c[0], c[1]))
+            for score, _, our_champ, winrate, confidence, samples in scored[:top_k]:
+                role_counters[role].append(
                     {
                         "our_champ": our_champ,
                         "their_champ": their_champ,
                         "expected_winrate": winrate,
-                        "samples": stats.games,
+                        "samples": samples,
                         "confidence": confidence,
                         "score": score,
                     }
                 )
 
-            candidates.sort(key=lambda x: x["score"], reverse=True)
-            for c in candidates[:top_k]:
-                role_counters[role].append(c)
-
     return {
         "personalization_level": personalization,
         "by_role": role_counters,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .grid_ingest import RawSeriesRecord
 
@@ -15,7 +18,7 @@ class TeamRef:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerPerf:
     player_id: str
     name: Optional[str]
@@ -25,7 +28,7 @@ class PlayerPerf:
     deaths: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamGameState:
     team_id: str
     won: Optional[bool]
@@ -35,7 +38,7 @@ class TeamGameState:
     players: List[PlayerPerf]
 
 
-@dataclass
+@dataclass(slots=True)
 class GameRecord:
     series_id: str
     game_number: int
@@ -54,47 +57,55 @@ def _safe_int(value: Any) -> int:
 
 
 def _get_character(player: Dict[str, Any]) -> Optional[str]:
-    for key in ("character", "champion", "agent"):
-        val = player.get(key)
-        if val:
-            if isinstance(val, dict):
-                return val.get("name") or val.get("id")
-            return str(val)
-    return None
-
-
-def _load_role_map() -> Dict[str, str]:
-    # Allow override via env var; fall back to bundled role_map.json
+    # First truthy key wins; GRID payloads almost always hit "character".
+    val = player.get("character") or player.get("champion") or player.get("agent")
+    if not val:
+        return None
+    if isinstance(val, dict):
+        return val.get("name") or val.get("id")
+    return val if type(val) is str else str(val)
+
+
+@lru_cache(maxsize=1)
+def _load_role_map() -> Mapping[str, str]:
+    # Allow override via env var; fall back to bundled role_map.json.
+    # Loaded once per process and shared read-only.
     override = os.environ.get("SCOUTING_ROLE_MAP")
     if override:
         path = Path(override)
         if path.exists():
-            return json.loads(path.read_text(encoding="utf-8"))
+            return MappingProxyType(json.loads(path.read_text(encoding="utf-8")))
     default_path = Path(__file__).with_name("role_map.json")
     if default_path.exists():
-        return json.loads(default_path.read_text(encoding="utf-8"))
-    return {}
+        return MappingProxyType(json.loads(default_path.read_text(encoding="utf-8")))
+    return MappingProxyType({})
 
 
 def _get_role(player: Dict[str, Any]) -> Optional[str]:
-    for key in ("role", "lane", "position"):
-        val = player.get(key)
-        if val:
-            return str(val)
-    return None
+    val = player.get("role") or player.get("lane") or player.get("position")
+    if not val:
+        return None
+    return val if type(val) is str else str(val)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Champion/role names and player/team ids repeat across every game and are
+    # used as dict keys downstream; interning shares one object and its
+    # cached hash.
+    return sys.intern(value) if type(value) is str else value
 
 
-def _normalize_players(players: List[Dict[str, Any]]) -> List[PlayerPerf]:
+def _normalize_players(players: List[Dict[str, Any]], role_map: Mapping[str, str]) -> List[PlayerPerf]:
     out: List[PlayerPerf] = []
-    role_map = _load_role_map()
     for p in players:
-        character = _get_character(p)
+        character = _intern(_get_character(p))
         role = _get_role(p)
         if not role and character:
             role = role_map.get(character)
+        role = _intern(role)
         out.append(
             PlayerPerf(
-                player_id=str(p.get("id") or ""),
+                player_id=_intern(str(p.get("id") or "")),
                 name=p.get("name"),
                 role=role,
                 character=character,
@@ -105,14 +116,14 @@ def _normalize_players(players: List[Dict[str, Any]]) -> List[PlayerPerf]:
     return out
 
 
-def _team_state_from_entry(entry: Dict[str, Any]) -> TeamGameState:
+def _team_state_from_entry(entry: Dict[str, Any], role_map: Mapping[str, str]) -> TeamGameState:
     return TeamGameState(
-        team_id=str(entry.get("id") or ""),
+        team_id=_intern(str(entry.get("id") or "")),
         won=entry.get("won") if entry.get("won") is not None else None,
         score=_safe_int(entry.get("score")) if entry.get("score") is not None else None,
         kills=_safe_int(entry.get("kills")),
         deaths=_safe_int(entry.get("deaths")),
-        players=_normalize_players(entry.get("players") or []),
+        players=_normalize_players(entry.get("players") or [], role_map),
     )
 
 
@@ -124,12 +135,21 @@ def _result_from_states(team: TeamGameState, opponent: TeamGameState) -> str:
     return "unknown"
 
 
+def _index_teams(teams: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    # First entry wins on duplicate ids, matching a linear scan.
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for t in teams:
+        by_id.setdefault(str(t.get("id")), t)
+    return by_id
+
+
 def normalize_records(
     records: List[RawSeriesRecord],
     team_id: str,
     opponent_id: str,
 ) -> List[GameRecord]:
     games: List[GameRecord] = []
+    role_map = _load_role_map()
 
     for record in records:
         state = record.series_state or {}
@@ -137,13 +157,13 @@ def normalize_records(
 
         if state_games:
             for g in state_games:
-                teams = g.get("teams") or []
-                team_entry = next((t for t in teams if str(t.get("id")) == team_id), None)
-                opp_entry = next((t for t in teams if str(t.get("id")) == opponent_id), None)
+                teams_by_id = _index_teams(g.get("teams") or [])
+                team_entry = teams_by_id.get(team_id)
+                opp_entry = teams_by_id.get(opponent_id)
                 if not team_entry or not opp_entry:
                     continue
-                team_state = _team_state_from_entry(team_entry)
-                opp_state = _team_state_from_entry(opp_entry)
+                team_state = _team_state_from_entry(team_entry, role_map)
+                opp_state = _team_state_from_entry(opp_entry, role_map)
                 games.append(
                     GameRecord(
                         series_id=record.series_id,
@@ -158,13 +178,13 @@ def normalize_records(
             continue
 
         # Fallback: no games array, use series_state.teams aggregates if available
-        teams = state.get("teams") or []
-        team_entry = next((t for t in teams if str(t.get("id")) == team_id), None)
-        opp_entry = next((t for t in teams if str(t.get("id")) == opponent_id), None)
+        teams_by_id = _index_teams(state.get("teams") or [])
+        team_entry = teams_by_id.get(team_id)
+        opp_entry = teams_by_id.get(opponent_id)
         if not team_entry or not opp_entry:
             continue
-        team_state = _team_state_from_entry(team_entry)
-        opp_state = _team_state_from_entry(opp_entry)
+        team_state = _team_state_from_entry(team_entry, role_map)
+        opp_state = _team_state_from_entry(opp_entry, role_map)
         games.append(
             GameRecord(
                 series_id=record.series_id,
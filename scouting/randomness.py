@@ -2,50 +2,76 @@ from __future__ import annotations
 
 import math
 from collections import Counter, defaultdict
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from .features import _entropy
+from .features import _entropy, _entropy_counts
+from .frame import OpponentFrame, build_opponent_frame
 from .normalize import GameRecord
-from .scenarios import cluster_scenarios
+from .scenarios import ScenarioCard, cluster_scenarios
 
 
-def _distribution_from_games(games: List[GameRecord]) -> Dict[str, float]:
-    counts: Counter = Counter()
-    for g in games:
-        for p in g.opponent.players:
-            if p.character:
-                counts[p.character] += 1
-    return {k: float(v) for k, v in counts.items()}
-
-
-def _normalize(dist: Dict[str, float]) -> Dict[str, float]:
-    total = sum(dist.values())
-    if total <= 0:
-        return {k: 0.0 for k in dist}
-    return {k: v / total for k, v in dist.items()}
-
-
-def _js_divergence(p: Dict[str, float], q: Dict[str, float]) -> float:
-    keys = set(p.keys()) | set(q.keys())
-    p_norm = _normalize({k: p.get(k, 0.0) for k in keys})
-    q_norm = _normalize({k: q.get(k, 0.0) for k in keys})
-    m = {k: 0.5 * (p_norm[k] + q_norm[k]) for k in keys}
-
-    def kl(a: Dict[str, float], b: Dict[str, float]) -> float:
-        s = 0.0
-        for k in keys:
-            if a[k] > 0 and b[k] > 0:
-                s += a[k] * math.log(a[k] / b[k], 2)
-        return s
-
-    return 0.5 * (kl(p_norm, m) + kl(q_norm, m))
-
-
-def _sorted_by_time(games: List[GameRecord]) -> List[GameRecord]:
-    return sorted(games, key=lambda g: g.start_time)
-
-
-def compute_randomness(games: List[GameRecord]) -> Dict[str, float | str]:
+def _encode_characters(
+    frame: OpponentFrame,
+) -> Tuple[List[str], List[List[int]], Dict[str, Counter]]:
+    # Single walk over the player columns: assign each champion a dense id,
+    # record every game's picks as ids, and count each player's champions.
+    vocab: Dict[str, int] = {}
+    game_ids: List[List[int]] = []
+    per_player: Dict[str, Counter] = defaultdict(Counter)
+    characters = frame.character
+    player_ids = frame.player_id
+    for i in range(len(frame)):
+        ids: List[int] = []
+        for j in frame.players(i):
+            character = characters[j]
+            if character:
+                ids.append(vocab.setdefault(character, len(vocab)))
+                if player_ids[j]:
+                    per_player[player_ids[j]][character] += 1
+        game_ids.append(ids)
+    return list(vocab), game_ids, per_player
+
+
+def _distribution_from_games(
+    game_ids: List[List[int]],
+    game_indices: Iterable[int],
+    size: int,
+) -> List[float]:
+    # Counter's C counting loop over the chained picks, then one scatter
+    # into the dense vector.
+    counts = Counter(chain.from_iterable(game_ids[i] for i in game_indices))
+    dist = [0.0] * size
+    for cid, n in counts.items():
+        dist[cid] = float(n)
+    return dist
+
+
+def _js_divergence(p: List[float], q: List[float]) -> float:
+    # p and q are aligned on the same champion ids; normalize and accumulate
+    # both KL(p || m) and KL(q || m) in a single pass.
+    p_total = sum(p)
+    q_total = sum(q)
+    p_vals = [v / p_total for v in p] if p_total > 0 else [0.0] * len(p)
+    q_vals = [v / q_total for v in q] if q_total > 0 else [0.0] * len(q)
+
+    kl_p = 0.0
+    kl_q = 0.0
+    for a, b in zip(p_vals, q_vals):
+        m = 0.5 * (a + b)
+        if m > 0:
+            if a > 0:
+                kl_p += a * math.log2(a / m)
+            if b > 0:
+                kl_q += b * math.log2(b / m)
+    return 0.5 * (kl_p + kl_q)
+
+
+def compute_randomness(
+    games: List[GameRecord],
+    frame: Optional[OpponentFrame] = None,
+    scenarios: Optional[List[ScenarioCard]] = None,
+) -> Dict[str, float | str]:
     if not games:
         return {
             "draft_entropy": 0.0,
@@ -57,28 +83,27 @@ def compute_randomness(games: List[GameRecord]) -> Dict[str, float | str]:
             "advice": "collect more games",
         }
 
-    team_dist = _distribution_from_games(games)
-    draft_entropy = _entropy(team_dist)
+    if frame is None:
+        frame = build_opponent_frame(games)
 
-    per_player: Dict[str, Counter] = defaultdict(Counter)
-    for g in games:
-        for p in g.opponent.players:
-            if p.player_id and p.character:
-                per_player[p.player_id][p.character] += 1
-    player_entropies = [
-        _entropy({k: float(v) for k, v in counts.items()}) for counts in per_player.values()
-    ]
+    vocab, game_ids, per_player = _encode_characters(frame)
+    team_dist = _distribution_from_games(game_ids, range(len(frame)), len(vocab))
+    draft_entropy = _entropy_counts(team_dist)
+
+    player_entropies = [_entropy(counts) for counts in per_player.values()]
     player_entropy = sum(player_entropies) / len(player_entropies) if player_entropies else 0.0
 
-    scenarios = cluster_scenarios(games)
+    if scenarios is None:
+        scenarios = cluster_scenarios(games)
     scenario_dist = {str(s.scenario_id): s.share for s in scenarios}
     scenario_entropy = _entropy(scenario_dist)
 
-    ordered = _sorted_by_time(games)
+    ordered = frame.time_order
     split = max(1, int(len(ordered) * 0.75))
-    prev_games = ordered[:split]
-    recent_games = ordered[split:]
-    drift = _js_divergence(_distribution_from_games(prev_games), _distribution_from_games(recent_games))
+    drift = _js_divergence(
+        _distribution_from_games(game_ids, ordered[:split], len(vocab)),
+        _distribution_from_games(game_ids, ordered[split:], len(vocab)),
+    )
 
     score = 100.0 * (
         0.35 * draft_entropy + 0.25 * player_entropy + 0.25 * scenario_entropy + 0.15 * drift
@@ -1,53 +1,54 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 
-def render_text(report: Dict[str, Any]) -> str:
+def _render_lines(report: Dict[str, Any]) -> Iterator[str]:
     meta = report.get("meta", {})
     overview = report.get("opponent_overview", {})
     randomness = report.get("randomness", {})
     scenarios = report.get("scenarios", [])
     counters = report.get("counters", {}).get("by_role", {})
 
-    lines = []
-    lines.append("SCOUTING REPORT")
-    lines.append(f"Opponent: {meta.get('opponent_name')} | Team: {meta.get('team_name')}")
-    lines.append(f"Window: {meta.get('window_gte')} -> {meta.get('window_lte')}")
-    lines.append("")
+    yield "SCOUTING REPORT"
+    yield f"Opponent: {meta.get('opponent_name')} | Team: {meta.get('team_name')}"
+    yield f"Window: {meta.get('window_gte')} -> {meta.get('window_lte')}"
+    yield ""
 
-    lines.append("Overview")
-    lines.append(
+    yield "Overview"
+    yield (
         f"Games: {overview.get('games', 0)} | Wins: {overview.get('wins', 0)} | "
         f"Losses: {overview.get('losses', 0)} | Avg K/D: "
         f"{overview.get('avg_kills', 0):.2f}/{overview.get('avg_deaths', 0):.2f}"
     )
-    lines.append(
+    yield (
         f"Randomness: {randomness.get('score', 0):.1f} ({randomness.get('interpretation')})"
     )
-    lines.append("")
+    yield ""
 
-    lines.append("Scenarios")
+    yield "Scenarios"
     for s in scenarios[:4]:
-        lines.append(
+        yield (
             f"- Scenario {s.get('scenario_id')}: share {s.get('share', 0):.2f} | "
             f"winrate {s.get('winrate', 0):.2f} | volatility {s.get('volatility', 0):.2f}"
         )
         sig = s.get("signature_picks") or {}
         if sig:
-            lines.append("  signature: " + ", ".join(f"{r}:{c}" for r, c in sig.items()))
-        lines.append("  punish: " + (s.get("punish_plan") or ""))
+            yield "  signature: " + ", ".join(f"{r}:{c}" for r, c in sig.items())
+        yield "  punish: " + (s.get("punish_plan") or "")
 
-    lines.append("")
-    lines.append("Counter Ideas")
+    yield ""
+    yield "Counter Ideas"
     for role, items in counters.items():
         if not items:
             continue
-        lines.append(f"- {role}")
+        yield f"- {role}"
         for item in items[:3]:
-            lines.append(
+            yield (
                 f"  {item.get('our_champ')} vs {item.get('their_champ')} | "
                 f"wr {item.get('expected_winrate', 0):.2f} | samples {item.get('samples', 0)}"
             )
 
-    return "\n".join(lines)
+
+def render_text(report: Dict[str, Any]) -> str:
+    return "\n".join(_render_lines(report))
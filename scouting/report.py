@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+import heapq
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 from .features import (
     compute_data_coverage,
@@ -17,6 +20,7 @@ from .features import (
     compute_signature_cluster_cards,
     compute_player_similarity,
 )
+from .frame import OpponentFrame, build_opponent_frame
 from .insights_enhanced import generate_enhanced_insights
 from .grid_ingest import FetchMeta
 from .matchups import build_matchup_table, compute_our_pick_pools, suggest_counters
@@ -26,19 +30,25 @@ from .scenarios import cluster_scenarios_with_labels
 
 
 def _build_plan_template(
-    per_player: Dict[str, Any],
+    comfort_by_role: List[Tuple[Optional[str], List[Dict[str, Any]]]],
     draft: Dict[str, Any],
     randomness: Dict[str, Any],
 ) -> Dict[str, Any]:
     priority = [p.get("character") for p in (draft.get("priority_picks") or []) if p.get("character")]
     ban_core = priority[:3]
     comfort_bans = []
-    for p in per_player.values():
-        comfort = p.get("comfort_picks") or []
+    for _, comfort in comfort_by_role:
         if comfort and (comfort[0].get("share") or 0) >= 0.5:
             comfort_bans.append(comfort[0].get("character"))
-    ban_list = [c for c in (ban_core + comfort_bans) if c]
-    ban_list = list(dict.fromkeys(ban_list))[:5]
+    # First five distinct picks, core bans first
+    ban_list: List[str] = []
+    seen = set()
+    for c in chain(ban_core, comfort_bans):
+        if c and c not in seen:
+            seen.add(c)
+            ban_list.append(c)
+            if len(ban_list) == 5:
+                break
 
     draft_plan = (
         "Draft for flexibility; keep answers ready for "
@@ -58,37 +68,64 @@ def _normalize_axis(values: List[float]) -> List[float]:
     if not values:
         return []
     vmin = min(values)
-    vmax = max(values)
-    if vmax == vmin:
-        return [0.5 for _ in values]
-    return [(v - vmin) / (vmax - vmin) for v in values]
+    span = max(values) - vmin
+    if span == 0:
+        return [0.5] * len(values)
+    return [(v - vmin) / span for v in values]
+
+
+@dataclass(slots=True)
+class _ClusterTotals:
+    games: int = 0
+    wins: int = 0
+    kills: int = 0
+    deaths: int = 0
+    champs: Counter = field(default_factory=Counter)
+    roles: Counter = field(default_factory=Counter)
 
 
 def _build_scenario_viz(
-    clusters: Dict[int, List[GameRecord]],
+    frame: OpponentFrame,
+    labels: List[int],
 ) -> List[Dict[str, Any]]:
+    # One pass over the frame accumulates every cluster's totals with a
+    # single lookup per game; clusters keep first-seen label order, matching
+    # cluster_scenarios_with_labels.
+    totals: Dict[int, _ClusterTotals] = {}
+    characters = frame.character
+    roles = frame.role
+    for i, label in enumerate(labels):
+        cid = int(label)
+        acc = totals.get(cid)
+        if acc is None:
+            acc = totals[cid] = _ClusterTotals()
+        acc.games += 1
+        if frame.won[i]:
+            acc.wins += 1
+        acc.kills += frame.kills[i]
+        acc.deaths += frame.deaths[i]
+        lo, hi = frame.offsets[i], frame.offsets[i + 1]
+        acc.champs.update(filter(None, characters[lo:hi]))
+        acc.roles.update(filter(None, roles[lo:hi]))
+
     items: List[Dict[str, Any]] = []
-    for cid, games in clusters.items():
-        if not games:
-            continue
-        total = len(games)
-        wins = sum(1 for g in games if g.opponent.won is True)
-        champ_counts: Dict[str, int] = {}
-        role_counts: Dict[str, int] = {}
-        kills = 0
-        deaths = 0
-        for g in games:
-            kills += g.opponent.kills
-            deaths += g.opponent.deaths
-            for p in g.opponent.players:
-                if p.character:
-                    champ_counts[p.character] = champ_counts.get(p.character, 0) + 1
-                if p.role:
-                    role_counts[p.role] = role_counts.get(p.role, 0) + 1
+    early_raw: List[float] = []
+    fight_raw: List[float] = []
+    vol_raw: List[float] = []
+    for cid, acc in totals.items():
+        total = acc.games
+        wins = acc.wins
+        kills = acc.kills
+        deaths = acc.deaths
+        champ_counts = acc.champs
+        role_counts = acc.roles
 
         total_picks = sum(role_counts.values()) or 1
         pick_buckets = {k: v / total_picks for k, v in role_counts.items()}
-        top_picks = sorted(champ_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_picks = champ_counts.most_common(5)
+        early_raw.append(kills / total)
+        fight_raw.append((kills + deaths) / total)
+        vol_raw.append(_entropy(champ_counts))
 
         items.append(
             {
@@ -97,23 +134,21 @@ def _build_scenario_viz(
                 "winrate": wins / total,
                 "pick_buckets": pick_buckets,
                 "top_picks": [c for c, _ in top_picks],
-                "early_aggression_raw": kills / total,
-                "teamfightiness_raw": (kills + deaths) / total,
-                "draft_volatility_raw": _entropy({k: float(v) for k, v in champ_counts.items()}),
+                "early_aggression_raw": early_raw[-1],
+                "teamfightiness_raw": fight_raw[-1],
+                "draft_volatility_raw": vol_raw[-1],
                 "macro_raw": None,
             }
         )
 
     # normalize axes for radar charts
-    early_vals = _normalize_axis([i["early_aggression_raw"] for i in items])
-    fight_vals = _normalize_axis([i["teamfightiness_raw"] for i in items])
-    vol_vals = _normalize_axis([i["draft_volatility_raw"] for i in items])
-
-    for idx, item in enumerate(items):
+    for item, early, vol, fight in zip(
+        items, _normalize_axis(early_raw), _normalize_axis(vol_raw), _normalize_axis(fight_raw)
+    ):
         item["fingerprint"] = {
-            "early_aggression": early_vals[idx],
-            "draft_volatility": vol_vals[idx],
-            "teamfightiness": fight_vals[idx],
+            "early_aggression": early,
+            "draft_volatility": vol,
+            "teamfightiness": fight,
             "macro": None,
         }
 
@@ -122,16 +157,14 @@ def _build_scenario_viz(
 
 def _build_counter_matrix(
     matchup_table: Dict[tuple, Any],
-    per_player: Dict[str, Any],
+    comfort_by_role: List[Tuple[Optional[str], List[Dict[str, Any]]]],
     our_pools: Dict[str, Dict[str, float]],
     max_rows: int = 6,
     max_cols: int = 6,
 ) -> Dict[str, Any]:
     # Collect opponent likely champs by role
     role_rows: Dict[str, List[str]] = {}
-    for p in per_player.values():
-        role = p.get("role")
-        picks = p.get("comfort_picks") or []
+    for role, picks in comfort_by_role:
         if not role or not picks:
             continue
         role_rows.setdefault(role, [])
@@ -144,17 +177,28 @@ def _build_counter_matrix(
     for picks in our_pools.values():
         for champ, w in picks.items():
             global_pool[champ] = global_pool.get(champ, 0.0) + w
-    cols = [c for c, _ in sorted(global_pool.items(), key=lambda x: x[1], reverse=True)[:max_cols]]
+    cols = [c for c, _ in heapq.nlargest(max_cols, global_pool.items(), key=lambda x: x[1])]
+
+    # Split the played matchups by role once, keeping only our candidate
+    # columns, so each role's sweep hits a small (ours, theirs) table. Most
+    # cells are unplayed, so a .get miss stays the common case.
+    col_set = set(cols)
+    role_tables: Dict[str, Dict[Tuple[str, str], Any]] = {role: {} for role in role_rows}
+    for (role, ours, theirs), stats in matchup_table.items():
+        table = role_tables.get(role)
+        if table is not None and ours in col_set:
+            table[(ours, theirs)] = stats
 
     matrix_by_role: Dict[str, Any] = {}
     for role, rows in role_rows.items():
         row_list = list(dict.fromkeys(rows))[:max_rows]
+        lookup = role_tables[role].get
         cells = []
         for r in row_list:
             row_cells = []
             for c in cols:
-                stats = matchup_table.get((role, c, r))
-                if stats:
+                stats = lookup((c, r))
+                if stats is not None:
                     row_cells.append(
                         {
                             "winrate": stats.posterior_winrate(),
@@ -180,21 +224,23 @@ def _build_decision_tree(
         cols = data.get("cols") or []
         cells = data.get("cells") or []
         for r_idx, opp_pick in enumerate(rows[:3]):
+            row = cells[r_idx]
+            # Best answer maximizes winrate * confidence; max() keeps the first
+            # column on ties, like the strict comparison scan it replaces.
+            best_idx = max(
+                (c_idx for c_idx in range(len(cols)) if row[c_idx].get("winrate") is not None),
+                key=lambda c_idx: (row[c_idx]["winrate"] or 0) * (row[c_idx]["confidence"] or 0),
+                default=None,
+            )
             best = None
-            best_score = -1.0
-            for c_idx, our_pick in enumerate(cols):
-                cell = cells[r_idx][c_idx]
-                if cell.get("winrate") is None:
-                    continue
-                score = (cell["winrate"] or 0) * (cell["confidence"] or 0)
-                if score > best_score:
-                    best_score = score
-                    best = {
-                        "our_pick": our_pick,
-                        "winrate": cell["winrate"],
-                        "samples": cell["samples"],
-                        "confidence": cell["confidence"],
-                    }
+            if best_idx is not None:
+                cell = row[best_idx]
+                best = {
+                    "our_pick": cols[best_idx],
+                    "winrate": cell["winrate"],
+                    "samples": cell["samples"],
+                    "confidence": cell["confidence"],
+                }
             follow_up = next((p for p in priority if p != opp_pick), None)
             nodes.append(
                 {
@@ -216,35 +262,48 @@ def build_report(
     per_player = compute_per_player_tendencies(games)
     draft = compute_team_draft_tendencies(games)
     coverage = compute_data_coverage(games)
-    scenarios, _, clusters = cluster_scenarios_with_labels(games)
-    randomness = compute_randomness(games)
+    scenarios, labels, clusters = cluster_scenarios_with_labels(games)
+    # Column-wise opponent view shared by the randomness and insight analyzers
+    frame = build_opponent_frame(games)
+    randomness = compute_randomness(games, frame=frame, scenarios=scenarios)
 
     matchup_table = build_matchup_table(games)
     if our_pools is None:
         our_pools = compute_our_pick_pools(games)
     counters = suggest_counters(matchup_table, per_player["per_player"], our_pools)
 
-    plan = _build_plan_template(per_player["per_player"], draft, randomness)
-    scenario_viz = _build_scenario_viz(clusters)
-    counter_matrix = _build_counter_matrix(matchup_table, per_player["per_player"], our_pools)
+    # (role, comfort_picks) per opponent player, shared by the plan and matrix
+    comfort_by_role = [
+        (p.get("role"), p.get("comfort_picks") or []) for p in per_player["per_player"].values()
+    ]
+    plan = _build_plan_template(comfort_by_role, draft, randomness)
+    scenario_viz = _build_scenario_viz(frame, labels)
+    counter_matrix = _build_counter_matrix(matchup_table, comfort_by_role, our_pools)
     decision_tree = _build_decision_tree(counter_matrix, draft)
 
-    # Stable / comparison insights
+    # Stable / comparison insights; per-side tables computed here are handed
+    # to the insights that would otherwise rebuild them.
     stable_opponent = compute_champion_winrates(games, side="opponent", min_games=3)
     stable_team = compute_champion_winrates(games, side="team", min_games=3)
     roster_opponent = compute_roster_stability(games, side="opponent")
     roster_team = compute_roster_stability(games, side="team")
-    style_triangle = compute_style_triangle(games)
+    style_triangle = compute_style_triangle(
+        games, roster_stability={"opponent": roster_opponent, "team": roster_team}
+    )
     draft_dna_opponent = compute_draft_dna_summary(games, side="opponent")
-    counterfactual_bans = compute_counterfactual_bans(games, side="opponent", min_games=3)
+    counterfactual_bans = compute_counterfactual_bans(
+        games, side="opponent", min_games=3, champ_stats=stable_opponent
+    )
     signature_opponent = compute_signature_cluster_cards(games, side="opponent")
     signature_team = compute_signature_cluster_cards(games, side="team")
     player_similarity_opponent = compute_player_similarity(games, side="opponent")
     player_similarity_team = compute_player_similarity(games, side="team")
 
-    stable_opp_set = {c["character"] for c in stable_opponent if c.get("stable")}
-    stable_team_set = {c["character"] for c in stable_team if c.get("stable")}
-    stable_overlap = sorted(stable_opp_set & stable_team_set)
+    stable_opp_picks = [c for c in stable_opponent if c.get("stable")]
+    stable_team_picks = [c for c in stable_team if c.get("stable")]
+    stable_overlap = sorted(
+        {c["character"] for c in stable_opp_picks} & {c["character"] for c in stable_team_picks}
+    )
 
     missing_data = {
         "bans": draft.get("missing_bans", True),
@@ -261,6 +320,7 @@ def build_report(
         counters=counters,
         randomness=randomness,
         opponent_name=meta.opponent_name or "Opponent",
+        frame=frame,
     )
 
     return {
@@ -269,14 +329,14 @@ def build_report(
         "opponent_overview": outcomes,
         "per_player": per_player["per_player"],
         "draft_tendencies": draft,
-        "scenarios": [s.__dict__ for s in scenarios],
+        "scenarios": [s.as_dict() for s in scenarios],
         "counters": counters,
         "randomness": randomness,
         "plan": plan,
         "insights": {
             "stable_champions": {
-                "opponent": [c for c in stable_opponent if c.get("stable")],
-                "team": [c for c in stable_team if c.get("stable")],
+                "opponent": stable_opp_picks,
+                "team": stable_team_picks,
             },
             "roster_stability": {
                 "opponent": roster_opponent,
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import io
 import json
 import math
 import os
-import tempfile
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib
+import numpy as np
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt  # noqa: E402
@@ -19,37 +24,74 @@ from reportlab.lib.units import inch  # noqa: E402
 from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle  # noqa: E402
 
 
-def _load_report(path: str) -> Dict[str, Any]:
+# Pure style data, shared by every build_pdf call in the process
+_STYLES = getSampleStyleSheet()
+_TITLE = _STYLES["Title"]
+_H2 = _STYLES["Heading2"]
+_H3 = _STYLES["Heading3"]
+_BODY = _STYLES["BodyText"]
+_STABLE_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("BACKGROUND", (0, 1), (-1, 1), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 8),
+    ]
+)
+
+
+@lru_cache(maxsize=8)
+def _load_report_cached(path: str, mtime: float) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def _save_plot(fig, path: str) -> str:
-    fig.tight_layout()
-    fig.savefig(path, dpi=160)
-    plt.close(fig)
-    return path
+def _load_report(path: str) -> Dict[str, Any]:
+    # Keyed on mtime so an edited report is re-read; callers treat it as read-only.
+    return _load_report_cached(path, os.path.getmtime(path))
+
+
+_FIGURE = None
+
 
+def _figure(figsize: Tuple[float, float]) -> Any:
+    # One Figure per process (each pool worker gets its own), cleared and
+    # resized per plot instead of paying Figure/canvas setup every time.
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(constrained_layout=True)
+    _FIGURE.clear()
+    _FIGURE.set_size_inches(*figsize)
+    return _FIGURE
 
-def _plot_strategy_clusters(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    clusters = report.get("visualization", {}).get("strategy_clusters") or []
+
+def _save_plot(fig) -> bytes:
+    # PNG bytes rather than a file: they go straight into the PDF, and plain
+    # bytes pickle cheaply back from pool workers.
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=120)
+    return buf.getvalue()
+
+
+def _plot_strategy_clusters(viz: Dict[str, Any]) -> Optional[bytes]:
+    clusters = viz.get("strategy_clusters") or []
     if not clusters:
         return None
 
     # Build stacked bars from pick_buckets
-    buckets = sorted({k for c in clusters for k in (c.get("pick_buckets") or {}).keys()})
+    pick_buckets = [c.get("pick_buckets") or {} for c in clusters]
+    buckets = sorted({k for pb in pick_buckets for k in pb})
     if not buckets:
         return None
     labels = [f"S{c.get('scenario_id')}" for c in clusters]
-    shares = [c.get("share", 0.0) for c in clusters]
     winrates = [c.get("winrate", 0.0) for c in clusters]
+    shares = np.array([[float(pb.get(b, 0.0)) for pb in pick_buckets] for b in buckets])
+    bottoms = np.vstack([np.zeros(len(clusters)), np.cumsum(shares, axis=0)[:-1]])
 
-    fig, ax = plt.subplots(figsize=(7, 3.5))
-    bottoms = [0.0] * len(clusters)
-    for b in buckets:
-        vals = [float((c.get("pick_buckets") or {}).get(b, 0.0)) for c in clusters]
-        ax.bar(labels, vals, bottom=bottoms, label=b)
-        bottoms = [b0 + v for b0, v in zip(bottoms, vals)]
+    fig = _figure((7, 3.5))
+    ax = fig.subplots()
+    for b, vals, bottom in zip(buckets, shares, bottoms):
+        ax.bar(labels, vals, bottom=bottom, label=b)
 
     ax2 = ax.twinx()
     ax2.plot(labels, winrates, color="black", marker="o", linewidth=1.5, label="winrate")
@@ -59,24 +101,28 @@ def _plot_strategy_clusters(report: Dict[str, Any], out_path: str) -> Optional[s
     ax2.set_ylabel("Winrate")
     ax.legend(loc="upper left", fontsize=8)
     ax2.legend(loc="upper right", fontsize=8)
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_scenario_radar(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    clusters = report.get("visualization", {}).get("strategy_clusters") or []
-    axes = report.get("visualization", {}).get("scenario_fingerprint_axes") or []
+def _plot_scenario_radar(viz: Dict[str, Any]) -> Optional[bytes]:
+    clusters = viz.get("strategy_clusters") or []
+    axes = viz.get("scenario_fingerprint_axes") or []
     if not clusters or not axes:
         return None
 
-    fig = plt.figure(figsize=(6, 4))
+    fig = _figure((6, 4))
     ax = fig.add_subplot(111, polar=True)
-    angles = [n / float(len(axes)) * 2 * math.pi for n in range(len(axes))]
-    angles += angles[:1]
+    # The closing angle 2*pi coincides with 0, so each polygon closes on itself
+    angles = np.linspace(0.0, 2.0 * math.pi, len(axes) + 1)
 
-    for c in clusters[:4]:
+    shown = clusters[:4]
+    # One (clusters, axes + 1) array; the first axis is repeated to close each polygon
+    fingerprints = np.zeros((len(shown), len(axes) + 1))
+    for row, c in zip(fingerprints, shown):
         fp = c.get("fingerprint") or {}
-        vals = [float(fp.get(a, 0.0) or 0.0) for a in axes]
-        vals += vals[:1]
+        row[:-1] = [float(fp.get(a, 0.0) or 0.0) for a in axes]
+    fingerprints[:, -1] = fingerprints[:, 0]
+    for c, vals in zip(shown, fingerprints):
         ax.plot(angles, vals, linewidth=1.5, label=f"S{c.get('scenario_id')}")
         ax.fill(angles, vals, alpha=0.1)
 
@@ -85,21 +131,24 @@ def _plot_scenario_radar(report: Dict[str, Any], out_path: str) -> Optional[str]
     ax.set_yticklabels([])
     ax.set_title("Scenario Fingerprint (Radar)")
     ax.legend(loc="upper right", bbox_to_anchor=(1.2, 1.1), fontsize=7)
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_counter_matrix(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    matrix = report.get("visualization", {}).get("counter_matrix") or {}
+def _plot_counter_matrix(viz: Dict[str, Any]) -> Optional[bytes]:
+    matrix = viz.get("counter_matrix") or {}
     if not matrix:
         return None
 
-    roles = list(matrix.keys())[:4]
+    roles = list(islice(matrix, 4))
     if not roles:
         return None
 
-    fig, axes = plt.subplots(1, len(roles), figsize=(5 * len(roles), 4))
+    fig = _figure((5 * len(roles), 4))
+    axes = fig.subplots(1, len(roles))
     if len(roles) == 1:
         axes = [axes]
+    cmap = plt.get_cmap("Blues").copy()
+    cmap.set_bad("lightgrey")
 
     for ax, role in zip(axes, roles):
         data = matrix.get(role, {})
@@ -110,21 +159,19 @@ def _plot_counter_matrix(report: Dict[str, Any], out_path: str) -> Optional[str]
             ax.axis("off")
             ax.set_title(f"{role} (no data)")
             continue
-        # Build heatmap values
-        values = []
-        for r_idx in range(len(rows)):
-            row_vals = []
-            for c_idx in range(len(cols)):
-                cell = cells[r_idx][c_idx]
-                row_vals.append(cell.get("winrate") if cell else None)
-            values.append(row_vals)
-
-        # Plot
+        # Missing matchups stay NaN and are masked out rather than drawn as 0%
+        values = np.full((len(rows), len(cols)), np.nan, dtype=np.float32)
+        for r_idx, row in enumerate(cells[: len(rows)]):
+            for c_idx, cell in enumerate(row[: len(cols)]):
+                if cell and cell.get("winrate") is not None:
+                    values[r_idx, c_idx] = cell["winrate"]
+
         im = ax.imshow(
-            [[v if v is not None else 0 for v in row] for row in values],
+            np.ma.masked_invalid(values),
             vmin=0,
             vmax=1,
-            cmap="Blues",
+            cmap=cmap,
+            interpolation="nearest",
         )
         ax.set_xticks(range(len(cols)))
         ax.set_xticklabels(cols, rotation=45, ha="right", fontsize=7)
@@ -133,11 +180,11 @@ def _plot_counter_matrix(report: Dict[str, Any], out_path: str) -> Optional[str]
         ax.set_title(f"Counter Matrix ({role})")
         fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
 
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_style_triangle(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    style = report.get("insights", {}).get("style_triangle") or {}
+def _plot_style_triangle(insights: Dict[str, Any]) -> Optional[bytes]:
+    style = insights.get("style_triangle") or {}
     team = style.get("team") or {}
     opp = style.get("opponent") or {}
     if not team or not opp:
@@ -146,76 +193,75 @@ def _plot_style_triangle(report: Dict[str, Any], out_path: str) -> Optional[str]
     def _vec(s: Dict[str, Any]) -> List[float]:
         return [float(s.get("aggression", 0.0)), float(s.get("control", 0.0)), float(s.get("flexibility", 0.0))]
 
-    team_vals = _vec(team)
-    opp_vals = _vec(opp)
     axes = ["Aggression", "Control", "Flexibility"]
 
-    fig, ax = plt.subplots(figsize=(4.5, 4.5))
+    fig = _figure((4.5, 4.5))
+    ax = fig.subplots()
     x = [0, 1, 0.5, 0]
     y = [0, 0, math.sqrt(3) / 2, 0]
     ax.plot(x, y, color="gray")
 
-    def _plot_point(vals, label, color):
-        s = sum(vals)
-        if s <= 0 or all(v == 0 for v in vals):
-            px, py = 0.5, math.sqrt(3) / 6
-        else:
-            a, b, c = [v / s for v in vals]
-            px = 0.5 * (2 * b + c) / (a + b + c)
-            py = (math.sqrt(3) / 2) * (c / (a + b + c))
-        ax.scatter([px], [py], color=color, s=60, label=label)
-
-    _plot_point(team_vals, "Team", "#2a6fdb")
-    _plot_point(opp_vals, "Opponent", "#db5a2a")
+    # Normalize team/opponent rows to barycentric weights in one go; a row
+    # with no positive mass sits at the centroid.
+    vals = np.array([_vec(team), _vec(opp)])
+    totals = vals.sum(axis=1)
+    valid = totals > 0
+    weights = vals / np.where(valid, totals, 1.0)[:, None]
+    px = np.where(valid, 0.5 * (2 * weights[:, 1] + weights[:, 2]), 0.5)
+    py = np.where(valid, (math.sqrt(3) / 2) * weights[:, 2], math.sqrt(3) / 6)
+    for i, (label, color) in enumerate((("Team", "#2a6fdb"), ("Opponent", "#db5a2a"))):
+        ax.scatter(px[i], py[i], color=color, s=60, label=label)
     ax.text(0, -0.05, axes[0], ha="center", fontsize=8)
     ax.text(1, -0.05, axes[1], ha="center", fontsize=8)
     ax.text(0.5, math.sqrt(3) / 2 + 0.05, axes[2], ha="center", fontsize=8)
     ax.set_title("Style Triangle")
     ax.axis("off")
     ax.legend(loc="upper right", fontsize=8)
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_top_priority_picks(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    draft = report.get("draft_tendencies") or {}
+def _plot_top_priority_picks(draft: Dict[str, Any]) -> Optional[bytes]:
     picks = draft.get("priority_picks") or []
     if not picks:
         return None
     top = picks[:10]
     labels = [p.get("character") for p in top]
     values = [float(p.get("share") or 0.0) for p in top]
-    fig, ax = plt.subplots(figsize=(6.5, 3.5))
-    ax.barh(labels[::-1], values[::-1], color="#4a7ebb")
+    fig = _figure((6.5, 3.5))
+    ax = fig.subplots()
+    ax.barh(labels, values, color="#4a7ebb")
+    ax.invert_yaxis()
     ax.set_title("Opponent Priority Picks (Share)")
     ax.set_xlabel("Share")
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_player_volatility(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    players = list((report.get("per_player") or {}).values())
-    if not players:
+def _plot_player_volatility(per_player: Dict[str, Any]) -> Optional[bytes]:
+    if not per_player:
         return None
-    players.sort(key=lambda p: p.get("volatility", 0), reverse=True)
-    top = players[:10]
+    top = heapq.nlargest(10, per_player.values(), key=lambda p: p.get("volatility") or 0)
     labels = [p.get("name") or p.get("player_id") for p in top]
     values = [float(p.get("volatility") or 0.0) for p in top]
-    fig, ax = plt.subplots(figsize=(6.5, 3.5))
-    ax.barh(labels[::-1], values[::-1], color="#7c4ab8")
+    fig = _figure((6.5, 3.5))
+    ax = fig.subplots()
+    ax.barh(labels, values, color="#7c4ab8")
+    ax.invert_yaxis()
     ax.set_xlim(0, 1)
     ax.set_title("Player Volatility (Entropy)")
     ax.set_xlabel("Volatility")
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_signature_cluster_share(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    sig = report.get("insights", {}).get("signature_clusters", {}).get("opponent") or {}
+def _plot_signature_cluster_share(insights: Dict[str, Any]) -> Optional[bytes]:
+    sig = (insights.get("signature_clusters") or {}).get("opponent") or {}
     clusters = sig.get("clusters") or []
     if not clusters:
         return None
     labels = [f"C{c.get('cluster_id')}" for c in clusters]
     shares = [float(c.get("share") or 0.0) for c in clusters]
     winrates = [float(c.get("winrate") or 0.0) for c in clusters]
-    fig, ax = plt.subplots(figsize=(6.5, 3.5))
+    fig = _figure((6.5, 3.5))
+    ax = fig.subplots()
     ax.bar(labels, shares, color="#2f9e8f")
     ax2 = ax.twinx()
     ax2.plot(labels, winrates, color="black", marker="o", linewidth=1.5)
@@ -223,26 +269,27 @@ def _plot_signature_cluster_share(report: Dict[str, Any], out_path: str) -> Opti
     ax.set_ylabel("Share")
     ax2.set_ylabel("Winrate")
     ax2.set_ylim(0, 1)
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _plot_roster_stability(report: Dict[str, Any], out_path: str) -> Optional[str]:
-    roster = report.get("insights", {}).get("roster_stability") or {}
+def _plot_roster_stability(insights: Dict[str, Any]) -> Optional[bytes]:
+    roster = insights.get("roster_stability") or {}
     opp = roster.get("opponent") or {}
     team = roster.get("team") or {}
     if not opp and not team:
         return None
     labels = ["Opponent", "Team"]
     values = [float(opp.get("top5_share") or 0.0), float(team.get("top5_share") or 0.0)]
-    fig, ax = plt.subplots(figsize=(4.5, 3.2))
+    fig = _figure((4.5, 3.2))
+    ax = fig.subplots()
     ax.bar(labels, values, color=["#db5a2a", "#2a6fdb"])
     ax.set_ylim(0, 1)
     ax.set_title("Roster Stability (Top‑5 Share)")
-    return _save_plot(fig, out_path)
+    return _save_plot(fig)
 
 
-def _build_stable_table(report: Dict[str, Any]) -> Table:
-    stable = report.get("insights", {}).get("stable_champions") or {}
+def _build_stable_table(insights: Dict[str, Any]) -> Table:
+    stable = insights.get("stable_champions") or {}
     opp = stable.get("opponent") or []
     team = stable.get("team") or []
     rows = [["Opponent Stable Champs", "Winrate", "Games"], ["Team Stable Champs", "Winrate", "Games"]]
@@ -259,28 +306,24 @@ def _build_stable_table(report: Dict[str, Any]) -> Table:
     rows.append(_row(opp))
     rows.append(_row(team))
     table = Table(rows, colWidths=[3.6 * inch, 1.0 * inch, 0.8 * inch])
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("BACKGROUND", (0, 1), (-1, 1), colors.lightgrey),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ("FONT", (0, 0), (-1, -1), "Helvetica", 8),
-            ]
-        )
-    )
+    table.setStyle(_STABLE_TABLE_STYLE)
     return table
 
 
 def build_pdf(input_path: str, output_path: str) -> None:
     report = _load_report(input_path)
+    # Resolve the report sections once; the tables and plots read from these
+    viz = report.get("visualization") or {}
+    insights = report.get("insights") or {}
+    draft = report.get("draft_tendencies") or {}
+    per_player = report.get("per_player") or {}
 
-    styles = getSampleStyleSheet()
-    story: List[Any] = []
-    story.append(Paragraph("Scouting Report", styles["Title"]))
     meta = report.get("meta") or {}
-    story.append(Paragraph(f"{meta.get('team_name')} vs {meta.get('opponent_name')}", styles["Heading2"]))
-    story.append(Spacer(1, 0.2 * inch))
+    story: List[Any] = [
+        Paragraph("Scouting Report", _TITLE),
+        Paragraph(f"{meta.get('team_name')} vs {meta.get('opponent_name')}", _H2),
+        Spacer(1, 0.2 * inch),
+    ]
 
     # Overview + key takeaways
     overview = report.get("opponent_overview") or {}
@@ -291,100 +334,86 @@ def build_pdf(input_path: str, output_path: str) -> None:
     games = overview.get("games", 0)
     winrate = (wins / games) if games else 0.0
 
-    story.append(Paragraph("Snapshot", styles["Heading3"]))
-    story.append(
-        Paragraph(
-            f"Games analyzed: <b>{games}</b> • Opponent winrate: <b>{winrate:.0%}</b> "
-            f"• Avg K/D: <b>{overview.get('avg_kills', 0):.1f}/{overview.get('avg_deaths', 0):.1f}</b>",
-            styles["BodyText"],
-        )
-    )
-    story.append(
-        Paragraph(
-            f"Randomness: <b>{randomness.get('interpretation','n/a')}</b> "
-            f"(score {randomness.get('score',0):.0f}/100). {randomness.get('advice','')}",
-            styles["BodyText"],
-        )
+    story.extend(
+        [
+            Paragraph("Snapshot", _H3),
+            Paragraph(
+                f"Games analyzed: <b>{games}</b> • Opponent winrate: <b>{winrate:.0%}</b> "
+                f"• Avg K/D: <b>{overview.get('avg_kills', 0):.1f}/{overview.get('avg_deaths', 0):.1f}</b>",
+                _BODY,
+            ),
+            Paragraph(
+                f"Randomness: <b>{randomness.get('interpretation','n/a')}</b> "
+                f"(score {randomness.get('score',0):.0f}/100). {randomness.get('advice','')}",
+                _BODY,
+            ),
+            Spacer(1, 0.15 * inch),
+        ]
     )
-    story.append(Spacer(1, 0.15 * inch))
 
-    story.append(Paragraph("Draft Plan", styles["Heading3"]))
     ban_plan = ", ".join(plan.get("ban_plan") or []) or "-"
-    story.append(Paragraph(f"<b>Ban plan:</b> {ban_plan}", styles["BodyText"]))
+    story.extend([Paragraph("Draft Plan", _H3), Paragraph(f"<b>Ban plan:</b> {ban_plan}", _BODY)])
     if plan.get("draft_plan"):
-        story.append(Paragraph(f"<b>Draft plan:</b> {plan['draft_plan']}", styles["BodyText"]))
+        story.append(Paragraph(f"<b>Draft plan:</b> {plan['draft_plan']}", _BODY))
     story.append(Spacer(1, 0.2 * inch))
 
     # Stable champs table
-    story.append(Paragraph("Stable Picks (Quick View)", styles["Heading3"]))
-    story.append(_build_stable_table(report))
-    story.append(Spacer(1, 0.2 * inch))
+    story.extend([Paragraph("Stable Picks (Quick View)", _H3), _build_stable_table(insights), Spacer(1, 0.2 * inch)])
 
     # Scenarios summary text
     scenarios = report.get("scenarios") or []
     if scenarios:
-        story.append(Paragraph("Scenario Cards (Text)", styles["Heading3"]))
-        for s in scenarios:
-            sid = s.get("scenario_id")
-            share = s.get("share", 0.0)
-            winrate = s.get("winrate", 0.0)
-            punish = s.get("punish_plan", "")
-            story.append(
-                Paragraph(
-                    f"Scenario {sid}: share <b>{share:.0%}</b>, winrate <b>{winrate:.0%}</b>. "
-                    f"Punish: {punish}",
-                    styles["BodyText"],
-                )
+        story.append(Paragraph("Scenario Cards (Text)", _H3))
+        story.extend(
+            Paragraph(
+                f"Scenario {s.get('scenario_id')}: share <b>{s.get('share', 0.0):.0%}</b>, "
+                f"winrate <b>{s.get('winrate', 0.0):.0%}</b>. "
+                f"Punish: {s.get('punish_plan', '')}",
+                _BODY,
             )
+            for s in scenarios
+        )
         story.append(Spacer(1, 0.2 * inch))
 
     # Roster stability + stable overlap
-    insights = report.get("insights") or {}
     roster = insights.get("roster_stability") or {}
     overlap = insights.get("stable_overlap") or {}
-    story.append(Paragraph("Roster Stability & Shared Comforts", styles["Heading3"]))
     opp_rs = roster.get("opponent") or {}
     team_rs = roster.get("team") or {}
-    story.append(
-        Paragraph(
-            f"Opponent roster stability (top‑5 share): <b>{(opp_rs.get('top5_share') or 0):.2f}</b> "
-            f"across {opp_rs.get('games_total', 0)} games. "
-            f"Team roster stability: <b>{(team_rs.get('top5_share') or 0):.2f}</b>.",
-            styles["BodyText"],
-        )
-    )
     shared = overlap.get("shared_champions") or []
-    story.append(
-        Paragraph(
-            f"Shared stable champs (direct contest risk): <b>{', '.join(shared[:8]) if shared else '-'}</b>",
-            styles["BodyText"],
-        )
+    story.extend(
+        [
+            Paragraph("Roster Stability & Shared Comforts", _H3),
+            Paragraph(
+                f"Opponent roster stability (top‑5 share): <b>{(opp_rs.get('top5_share') or 0):.2f}</b> "
+                f"across {opp_rs.get('games_total', 0)} games. "
+                f"Team roster stability: <b>{(team_rs.get('top5_share') or 0):.2f}</b>.",
+                _BODY,
+            ),
+            Paragraph(
+                f"Shared stable champs (direct contest risk): <b>{', '.join(shared[:8]) if shared else '-'}</b>",
+                _BODY,
+            ),
+            Spacer(1, 0.2 * inch),
+        ]
     )
-    story.append(Spacer(1, 0.2 * inch))
 
     # Draft tendencies (priority + flex)
-    draft = report.get("draft_tendencies") or {}
-    priority = [p.get("character") for p in (draft.get("priority_picks") or []) if p.get("character")]
+    # Only the first ten named picks are shown; stop scanning once we have them
+    priority = list(islice((p.get("character") for p in (draft.get("priority_picks") or []) if p.get("character")), 10))
     flex = draft.get("flex_picks") or []
-    story.append(Paragraph("Draft Tendencies", styles["Heading3"]))
-    story.append(
-        Paragraph(
-            f"Priority picks: <b>{', '.join(priority[:10]) if priority else '-'}</b>",
-            styles["BodyText"],
-        )
-    )
-    story.append(
-        Paragraph(
-            f"Flex picks (multi‑role): <b>{', '.join(flex[:10]) if flex else '-'}</b>",
-            styles["BodyText"],
-        )
+    story.extend(
+        [
+            Paragraph("Draft Tendencies", _H3),
+            Paragraph(f"Priority picks: <b>{', '.join(priority) if priority else '-'}</b>", _BODY),
+            Paragraph(f"Flex picks (multi‑role): <b>{', '.join(flex[:10]) if flex else '-'}</b>", _BODY),
+            Spacer(1, 0.2 * inch),
+        ]
     )
-    story.append(Spacer(1, 0.2 * inch))
 
     # Per-player tendencies (top comfort + volatility)
-    per_player = report.get("per_player") or {}
     if per_player:
-        story.append(Paragraph("Key Player Tendencies", styles["Heading3"]))
+        story.append(Paragraph("Key Player Tendencies", _H3))
         # Sort by volatility descending to highlight chaotic players
         rows = list(per_player.values())
         rows.sort(key=lambda r: r.get("volatility", 0), reverse=True)
@@ -396,7 +425,7 @@ def build_pdf(input_path: str, output_path: str) -> None:
                     f"{p.get('name') or p.get('player_id')}: "
                     f"comfort <b>{', '.join(comfort_list) if comfort_list else '-'}</b>, "
                     f"volatility <b>{p.get('volatility', 0):.2f}</b>.",
-                    styles["BodyText"],
+                    _BODY,
                 )
             )
         story.append(Spacer(1, 0.2 * inch))
@@ -405,17 +434,16 @@ def build_pdf(input_path: str, output_path: str) -> None:
     sig = insights.get("signature_clusters") or {}
     opp_sig = sig.get("opponent") or {}
     if opp_sig:
-        story.append(Paragraph("Signature Cluster Cards (Opponent)", styles["Heading3"]))
-        for c in (opp_sig.get("clusters") or [])[:4]:
-            champs = ", ".join(c.get("top_champs") or [])
-            story.append(
-                Paragraph(
-                    f"Cluster {c.get('cluster_id')}: share <b>{(c.get('share') or 0):.0%}</b>, "
-                    f"winrate <b>{(c.get('winrate') or 0):.0%}</b>, "
-                    f"top champs: <b>{champs or '-'}</b>.",
-                    styles["BodyText"],
-                )
+        story.append(Paragraph("Signature Cluster Cards (Opponent)", _H3))
+        story.extend(
+            Paragraph(
+                f"Cluster {c.get('cluster_id')}: share <b>{(c.get('share') or 0):.0%}</b>, "
+                f"winrate <b>{(c.get('winrate') or 0):.0%}</b>, "
+                f"top champs: <b>{', '.join(c.get('top_champs') or []) or '-'}</b>.",
+                _BODY,
             )
+            for c in (opp_sig.get("clusters") or [])[:4]
+        )
         story.append(Spacer(1, 0.2 * inch))
 
     # Player similarity graph summary
@@ -423,7 +451,7 @@ def build_pdf(input_path: str, output_path: str) -> None:
     opp_sim = sim.get("opponent") or {}
     edges = opp_sim.get("edges") or []
     if edges:
-        story.append(Paragraph("Player Similarity (Champion Pool Overlap)", styles["Heading3"]))
+        story.append(Paragraph("Player Similarity (Champion Pool Overlap)", _H3))
         for e in edges[:8]:
             a = e.get("player_a", {})
             b = e.get("player_b", {})
@@ -432,79 +460,93 @@ def build_pdf(input_path: str, output_path: str) -> None:
                     f"{a.get('name') or a.get('id')} ↔ {b.get('name') or b.get('id')}: "
                     f"Jaccard <b>{(e.get('similarity') or 0):.2f}</b> "
                     f"(shared: {', '.join(e.get('shared_champs') or [])})",
-                    styles["BodyText"],
+                    _BODY,
                 )
             )
         story.append(Spacer(1, 0.2 * inch))
 
     # Counterfactual bans
-    cf = report.get("insights", {}).get("counterfactual_bans") or []
+    cf = insights.get("counterfactual_bans") or []
     if cf:
         c = cf[0]
-        story.append(Paragraph("Counterfactual Ban Impact", styles["Heading3"]))
-        story.append(
-            Paragraph(
-                f"If they lose <b>{c.get('ban_champ')}</b>, replacement <b>{c.get('replacement')}</b> "
-                f"projects ~{(c.get('estimated_winrate_drop') or 0):.0%} winrate drop.",
-                styles["BodyText"],
-            )
+        story.extend(
+            [
+                Paragraph("Counterfactual Ban Impact", _H3),
+                Paragraph(
+                    f"If they lose <b>{c.get('ban_champ')}</b>, replacement <b>{c.get('replacement')}</b> "
+                    f"projects ~{(c.get('estimated_winrate_drop') or 0):.0%} winrate drop.",
+                    _BODY,
+                ),
+                Spacer(1, 0.2 * inch),
+            ]
         )
-        story.append(Spacer(1, 0.2 * inch))
 
-    with tempfile.TemporaryDirectory() as tmp:
-        # Graphs
-        plots = [
-            (
-                "strategy.png",
-                _plot_strategy_clusters,
-                "Strategy clusters: stacked bars show pick‑style buckets per scenario; line is winrate.",
-            ),
-            (
-                "radar.png",
-                _plot_scenario_radar,
-                "Scenario fingerprint: radar of aggression, volatility, teamfightiness, and macro (if available).",
-            ),
-            (
-                "matrix.png",
-                _plot_counter_matrix,
-                "Counter matrix: rows = opponent likely champs, columns = your answers; color = smoothed winrate.",
-            ),
-            (
-                "style.png",
-                _plot_style_triangle,
-                "Style triangle: relative balance of aggression, control, and flexibility for team vs opponent.",
-            ),
-            (
-                "priority.png",
-                _plot_top_priority_picks,
-                "Priority picks: opponent’s most frequent champions in this window.",
-            ),
-            (
-                "volatility.png",
-                _plot_player_volatility,
-                "Player volatility: higher entropy = wider champion pool / less predictable.",
-            ),
-            (
-                "clusters.png",
-                _plot_signature_cluster_share,
-                "Signature clusters: share of each gameplan + winrate trend.",
-            ),
-            (
-                "roster.png",
-                _plot_roster_stability,
-                "Roster stability: share of games played by the top 5 players.",
-            ),
-        ]
-        for name, fn, caption in plots:
-            path = os.path.join(tmp, name)
-            img = fn(report, path)
-            if img and os.path.exists(img):
-                story.append(Paragraph(caption, styles["BodyText"]))
-                story.append(Image(img, width=6.5 * inch, height=3.5 * inch))
-                story.append(Spacer(1, 0.2 * inch))
-
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
-        doc.build(story)
+    # Graphs
+    plots = [
+        (
+            _plot_strategy_clusters,
+            viz,
+            "Strategy clusters: stacked bars show pick‑style buckets per scenario; line is winrate.",
+        ),
+        (
+            _plot_scenario_radar,
+            viz,
+            "Scenario fingerprint: radar of aggression, volatility, teamfightiness, and macro (if available).",
+        ),
+        (
+            _plot_counter_matrix,
+            viz,
+            "Counter matrix: rows = opponent likely champs, columns = your answers; color = smoothed winrate.",
+        ),
+        (
+            _plot_style_triangle,
+            insights,
+            "Style triangle: relative balance of aggression, control, and flexibility for team vs opponent.",
+        ),
+        (
+            _plot_top_priority_picks,
+            draft,
+            "Priority picks: opponent’s most frequent champions in this window.",
+        ),
+        (
+            _plot_player_volatility,
+            per_player,
+            "Player volatility: higher entropy = wider champion pool / less predictable.",
+        ),
+        (
+            _plot_signature_cluster_share,
+            insights,
+            "Signature clusters: share of each gameplan + winrate trend.",
+        ),
+        (
+            _plot_roster_stability,
+            insights,
+            "Roster stability: share of games played by the top 5 players.",
+        ),
+    ]
+    # Each plot is an independent Agg render dominated by savefig; fan them
+    # out to worker processes and keep the story in plot order. With a
+    # single worker the pool only adds startup and pickling, so render inline.
+    workers = min(len(plots), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(fn, section) for fn, section, _ in plots]
+            images = [f.result() for f in futures]
+    else:
+        images = [fn(section) for fn, section, _ in plots]
+
+    for (_, _, caption), png in zip(plots, images):
+        if png:
+            story.extend(
+                [
+                    Paragraph(caption, _BODY),
+                    Image(io.BytesIO(png), width=6.5 * inch, height=3.5 * inch),
+                    Spacer(1, 0.2 * inch),
+                ]
+            )
+
+    doc = SimpleDocTemplate(output_path, pagesize=letter)
+    doc.build(story)
 
 
 def main() -> None:
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import math
 import random
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from .features import _entropy
+from .features import _entropy_counts
 from .normalize import GameRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioCard:
     scenario_id: int
     share: float
@@ -19,27 +18,49 @@ class ScenarioCard:
     volatility: float
     punish_plan: str
 
+    def as_dict(self) -> Dict[str, Any]:
+        # Shallow field copy; dataclasses.asdict would deep-copy signature_picks
+        return {
+            "scenario_id": self.scenario_id,
+            "share": self.share,
+            "winrate": self.winrate,
+            "signature_picks": self.signature_picks,
+            "volatility": self.volatility,
+            "punish_plan": self.punish_plan,
+        }
 
-def _hash_feature(key: str, dim: int) -> int:
-    return abs(hash(key)) % dim
-
-
-def _game_vector(game: GameRecord, dim: int = 32) -> List[float]:
-    vec = [0.0] * dim
-    # role/champion hashed features
-    for p in game.opponent.players:
-        if p.role and p.character:
-            idx = _hash_feature(f"{p.role}:{p.character}", dim)
-            vec[idx] += 1.0
-    # numeric features
-    vec.append(float(game.opponent.kills))
-    vec.append(float(game.opponent.deaths))
-    vec.append(1.0 if game.opponent.won is True else 0.0)
-    return vec
 
-
-def _euclidean(a: List[float], b: List[float]) -> float:
-    return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+def _hash_feature(key: str, dim: int) -> int:
+    # dim is a power of two, so masking folds negative hashes in as well
+    return hash(key) & (dim - 1)
+
+
+def _feature_matrix(games: List[GameRecord], dim: int = 32) -> List[List[float]]:
+    # One row per game: hashed role/champion counts followed by kills, deaths
+    # and the win flag. Each distinct role/champion pair is hashed once.
+    assert dim > 0 and dim & (dim - 1) == 0, "feature dim must be a power of two"
+    slots: Dict[Tuple[str, str], int] = {}
+    rows: List[List[float]] = []
+    for g in games:
+        opp = g.opponent
+        vec = [0.0] * dim
+        for p in opp.players:
+            if p.role and p.character:
+                key = (p.role, p.character)
+                idx = slots.get(key)
+                if idx is None:
+                    idx = slots[key] = _hash_feature(f"{p.role}:{p.character}", dim)
+                vec[idx] += 1.0
+        vec.append(float(opp.kills))
+        vec.append(float(opp.deaths))
+        vec.append(1.0 if opp.won is True else 0.0)
+        rows.append(vec)
+    return rows
+
+
+def _sq_distance(a: List[float], b: List[float]) -> float:
+    # Squared euclidean distance; nearest-center ranking doesn't need the sqrt
+    return sum((x - y) * (x - y) for x, y in zip(a, b))
 
 
 def _kmeans_fallback(vectors: List[List[float]], k: int, iterations: int = 10) -> List[int]:
@@ -48,36 +69,72 @@ def _kmeans_fallback(vectors: List[List[float]], k: int, iterations: int = 10) -
     centers = random.sample(vectors, k) if len(vectors) >= k else [vectors[0]] * k
     labels = [0] * len(vectors)
     for _ in range(iterations):
+        members: List[List[List[float]]] = [[] for _ in range(k)]
         for i, v in enumerate(vectors):
-            labels[i] = min(range(k), key=lambda c: _euclidean(v, centers[c]))
-        for c in range(k):
-            cluster = [v for v, lab in zip(vectors, labels) if lab == c]
+            label = min(range(k), key=lambda c: _sq_distance(v, centers[c]))
+            labels[i] = label
+            members[label].append(v)
+        for c, cluster in enumerate(members):
             if not cluster:
                 continue
             centers[c] = [sum(vals) / len(cluster) for vals in zip(*cluster)]
     return labels
 
 
-def _choose_k(vectors: List[List[float]]) -> int:
+# Above this many games, full-batch KMeans dominates clustering time.
+_MINIBATCH_MIN_GAMES = 500
+
+
+def _kmeans_model(k: int, n_samples: int) -> Any:
+    if n_samples > _MINIBATCH_MIN_GAMES:
+        from sklearn.cluster import MiniBatchKMeans  # type: ignore
+
+        return MiniBatchKMeans(n_clusters=k, n_init=3, batch_size=256, random_state=42)
+    from sklearn.cluster import KMeans  # type: ignore
+
+    return KMeans(n_clusters=k, n_init=5, random_state=42)
+
+
+def _choose_k(vectors: List[List[float]]) -> Tuple[int, Optional[List[int]]]:
+    """
+    Pick k by silhouette score. Also returns the winning fit's labels so the
+    caller doesn't refit the same model; None when no fit was kept.
+    """
     n = len(vectors)
     if n <= 2:
-        return max(1, n)
+        return max(1, n), None
     try:
-        from sklearn.cluster import KMeans  # type: ignore
         from sklearn.metrics import silhouette_score  # type: ignore
 
         best_k = 2
         best_score = -1.0
+        best_labels = None
         for k in range(2, min(4, n) + 1):
-            model = KMeans(n_clusters=k, n_init=5, random_state=42)
+            model = _kmeans_model(k, n)
             labels = model.fit_predict(vectors)
             score = silhouette_score(vectors, labels)
             if score > best_score:
                 best_score = score
                 best_k = k
-        return best_k
+                best_labels = labels
+        return best_k, (list(best_labels) if best_labels is not None else None)
     except Exception:
-        return min(3, n)
+        return min(3, n), None
+
+
+def _cluster_wins(games: List[GameRecord], labels: List[int]) -> List[float]:
+    # Opponent wins per cluster id, indexed by label.
+    try:
+        import numpy as np
+
+        won = np.fromiter((g.opponent.won is True for g in games), dtype=float, count=len(games))
+        return np.bincount(np.asarray(labels, dtype=np.intp), weights=won).tolist()
+    except ImportError:
+        wins = [0.0] * (max(labels) + 1)
+        for g, label in zip(games, labels):
+            if g.opponent.won is True:
+                wins[label] += 1.0
+        return wins
 
 
 def cluster_scenarios_with_labels(
@@ -85,16 +142,23 @@ def cluster_scenarios_with_labels(
 ) -> Tuple[List[ScenarioCard], List[int], Dict[int, List[GameRecord]]]:
     if not games:
         return [], [], {}
-    vectors = [_game_vector(g) for g in games]
-    k = _choose_k(vectors)
+    vectors = _feature_matrix(games)
+    try:
+        import numpy as np  # ships with scikit-learn
+
+        # Convert once so every KMeans fit and silhouette pass shares the array
+        data: Any = np.asarray(vectors, dtype=float)
+    except ImportError:
+        data = vectors
+    k, labels = _choose_k(data)
     if k == 1:
         labels = [0] * len(vectors)
-    else:
+    elif labels is None:
+        # _choose_k returns the sweep's labels for the chosen k (same KMeans
+        # parameters); fit here only when it couldn't keep one.
         try:
-            from sklearn.cluster import KMeans  # type: ignore
-
-            model = KMeans(n_clusters=k, n_init=5, random_state=42)
-            labels = list(model.fit_predict(vectors))
+            model = _kmeans_model(k, len(vectors))
+            labels = list(model.fit_predict(data))
         except Exception:
             labels = _kmeans_fallback(vectors, k)
 
@@ -102,12 +166,13 @@ def cluster_scenarios_with_labels(
     for g, label in zip(games, labels):
         clusters[int(label)].append(g)
 
+    wins_by_cluster = _cluster_wins(games, labels)
     cards: List[ScenarioCard] = []
     total_games = len(games)
     for cid, cluster_games in clusters.items():
         if not cluster_games:
             continue
-        winrate = sum(1 for g in cluster_games if g.opponent.won is True) / len(cluster_games)
+        winrate = wins_by_cluster[cid] / len(cluster_games)
         # signature picks by role
         role_counts: Dict[str, Counter] = defaultdict(Counter)
         champ_counts: Counter = Counter()
@@ -118,8 +183,10 @@ def cluster_scenarios_with_labels(
                 if p.character:
                     champ_counts[p.character] += 1
         signature = {role: cnt.most_common(1)[0][0] for role, cnt in role_counts.items() if cnt}
-        volatility = _entropy({k: float(v) for k, v in champ_counts.items()})
-        punish = "ban " + ", ".join(list(champ_counts.keys())[:2]) if champ_counts else "deny comfort picks"
+        volatility = _entropy_counts(champ_counts.values())
+        punish = (
+            "ban " + ", ".join(ch for ch, _ in champ_counts.most_common(2)) if champ_counts else "deny comfort picks"
+        )
         cards.append(
             ScenarioCard(
                 scenario_id=cid,
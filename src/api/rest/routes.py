@@ -1,9 +1,11 @@
 """REST API routes for team analysis."""
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from ..transformers.report_transformer import transform_report_to_frontend
 from ...application.ports.scouting_service import ProgressCallbackPort
@@ -19,6 +21,15 @@ from ...infrastructure.adapters.grid_scouting_adapter import (
 router = APIRouter(prefix="/api", tags=["analysis"])
 
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Encode a report dict straight to JSON bytes.
+
+    The transformed report is already plain JSON data, so this skips FastAPI's
+    jsonable_encoder walk and uses pydantic-core's native encoder instead.
+    """
+    return Response(content=to_json(payload), media_type="application/json")
+
+
 class AnalysisRequest(BaseModel):
     """Request body for team analysis."""
 
@@ -59,7 +70,7 @@ class ErrorResponse(BaseModel):
     details: dict = {}
 
 
-@router.get("/teams/{team_id}/analysis")
+@router.get("/teams/{team_id}/analysis", response_model=None)
 async def get_team_analysis(
     team_id: str,
     start_date: Optional[str] = Query(None, alias="startDate"),
@@ -86,16 +97,13 @@ async def get_team_analysis(
     Returns:
         TeamAnalysisReport in frontend format
     """
-    # Calculate window_days from dates if provided
-    window_days = 2000
-    if last_n_games:
-        # Approximate: assume ~3 games per week
-        window_days = max(30, last_n_games * 7 // 3)
+    # Approximate the window from lastNGames (~3 games per week), at least 30 days
+    window_days = max(30, last_n_games * 7 // 3) if last_n_games else 2000
 
     try:
         # Create adapters
         scouting_adapter = GridScoutingAdapter()
-        report_builder = GridReportBuilderAdapter(scouting_adapter)
+        report_builder = GridReportBuilderAdapter()
 
         # Execute use case
         use_case = GenerateReportUseCase(scouting_adapter, report_builder)
@@ -125,7 +133,7 @@ async def get_team_analysis(
             result.metadata or {},
         )
 
-        return frontend_report
+        return _json_response(frontend_report)
 
     except HTTPException:
         raise
@@ -153,7 +161,7 @@ async def get_team_analysis(
         )
 
 
-@router.post("/analysis/generate")
+@router.post("/analysis/generate", response_model=None)
 async def generate_analysis(request: AnalysisRequest):
     """Generate a new team analysis report.
 
@@ -168,7 +176,7 @@ async def generate_analysis(request: AnalysisRequest):
     try:
         # Create adapters
         scouting_adapter = GridScoutingAdapter()
-        report_builder = GridReportBuilderAdapter(scouting_adapter)
+        report_builder = GridReportBuilderAdapter()
 
         # Execute use case
         use_case = GenerateReportUseCase(scouting_adapter, report_builder)
@@ -202,7 +210,7 @@ async def generate_analysis(request: AnalysisRequest):
             result.metadata or {},
         )
 
-        return frontend_report
+        return _json_response(frontend_report)
 
     except HTTPException:
         raise
@@ -1,48 +1,115 @@
 """Transform backend report format to frontend expected format."""
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from heapq import nlargest
+from itertools import chain, islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 from ...domain.value_objects.types import Role
 
 logger = logging.getLogger(__name__)
 
 
-def _to_camel_case(snake_str: str) -> str:
-    """Convert snake_case to camelCase."""
-    components = snake_str.split("_")
-    return components[0] + "".join(x.title() for x in components[1:])
+_CANONICAL_ROLES = frozenset({"top", "jungle", "mid", "adc", "support"})
+# Display order for players; every role from _get_role_standard is listed
+_ROLE_ORDER: Mapping[str, int] = MappingProxyType({"top": 0, "jungle": 1, "mid": 2, "adc": 3, "support": 4})
+
+# Lowercased role aliases seen in GRID data -> canonical role
+_ROLE_MAP: Mapping[str, str] = MappingProxyType({
+    "top": "top",
+    "toplane": "top",
+    "top_lane": "top",
+    "jungle": "jungle",
+    "jng": "jungle",
+    "jungler": "jungle",
+    "mid": "mid",
+    "midlane": "mid",
+    "mid_lane": "mid",
+    "middle": "mid",
+    "adc": "adc",
+    "bot": "adc",
+    "botlane": "adc",
+    "bot_lane": "adc",
+    "carry": "adc",
+    "marksman": "adc",
+    "support": "support",
+    "sup": "support",
+    "supp": "support",
+})
+
+
+_GAMES_KEY = itemgetter("gamesPlayed")
+
+
+def _role_sort_key(player: Dict[str, Any]) -> int:
+    return _ROLE_ORDER[player["role"]]
 
 
 def _get_role_standard(role_str: str | None) -> str:
     """Standardize role names."""
     if not role_str:
         return "mid"
-    role_lower = role_str.lower()
-    role_map = {
-        "top": "top",
-        "toplane": "top",
-        "top_lane": "top",
-        "jungle": "jungle",
-        "jng": "jungle",
-        "jungler": "jungle",
-        "mid": "mid",
-        "midlane": "mid",
-        "mid_lane": "mid",
-        "middle": "mid",
-        "adc": "adc",
-        "bot": "adc",
-        "botlane": "adc",
-        "bot_lane": "adc",
-        "carry": "adc",
-        "marksman": "adc",
-        "support": "support",
-        "sup": "support",
-        "supp": "support",
-    }
-    return role_map.get(role_lower, "mid")
+    if role_str in _CANONICAL_ROLES:
+        return role_str
+    return _ROLE_MAP.get(role_str.lower(), "mid")
+
+
+_now_iso_cache: Tuple[int, str] = (0, "")
 
 
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 with a Z suffix, at second resolution.
+
+    Reports generated within the same second share one formatted string.
+    """
+    global _now_iso_cache
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        stamp = datetime.fromtimestamp(now, timezone.utc).isoformat().replace("+00:00", "Z")
+        _now_iso_cache = (now, stamp)
+    return _now_iso_cache[1]
+
+
+# Champions whose Data Dragon id differs from the display name
+_SPECIAL_CASES: Mapping[str, str] = MappingProxyType({
+    "Renata Glasc": "Renata",
+    "RenataGlasc": "Renata",
+    "Nunu & Willump": "Nunu",
+    "NunuWillump": "Nunu",
+    "Bel'Veth": "Belveth",
+    "BelVeth": "Belveth",
+    "Cho'Gath": "Chogath",
+    "ChoGath": "Chogath",
+    "Dr. Mundo": "DrMundo",
+    "Jarvan IV": "JarvanIV",
+    "Kai'Sa": "Kaisa",
+    "KaiSa": "Kaisa",
+    "Kha'Zix": "Khazix",
+    "KhaZix": "Khazix",
+    "K'Sante": "KSante",
+    "KSante": "KSante",
+    "LeBlanc": "Leblanc",
+    "Lee Sin": "LeeSin",
+    "Master Yi": "MasterYi",
+    "Miss Fortune": "MissFortune",
+    "Rek'Sai": "RekSai",
+    "RekSai": "RekSai",
+    "Tahm Kench": "TahmKench",
+    "Twisted Fate": "TwistedFate",
+    "Vel'Koz": "Velkoz",
+    "VelKoz": "Velkoz",
+    "Xin Zhao": "XinZhao",
+})
+
+# Characters Data Dragon ids drop from display names
+_STRIP_TABLE = str.maketrans("", "", " '.")
+
+
+@lru_cache(maxsize=1024)
 def _normalize_champion_name(name: str) -> str:
     """Normalize champion names for Riot's Data Dragon API.
 
@@ -54,45 +121,17 @@ def _normalize_champion_name(name: str) -> str:
     if not name:
         return name
 
-    # Special case mappings for champions with different internal names
-    special_cases = {
-        "Renata Glasc": "Renata",
-        "RenataGlasc": "Renata",
-        "Nunu & Willump": "Nunu",
-        "NunuWillump": "Nunu",
-        "Bel'Veth": "Belveth",
-        "BelVeth": "Belveth",
-        "Cho'Gath": "Chogath",
-        "ChoGath": "Chogath",
-        "Dr. Mundo": "DrMundo",
-        "Jarvan IV": "JarvanIV",
-        "Kai'Sa": "Kaisa",
-        "KaiSa": "Kaisa",
-        "Kha'Zix": "Khazix",
-        "KhaZix": "Khazix",
-        "K'Sante": "KSante",
-        "KSante": "KSante",
-        "LeBlanc": "Leblanc",
-        "Lee Sin": "LeeSin",
-        "Master Yi": "MasterYi",
-        "Miss Fortune": "MissFortune",
-        "Rek'Sai": "RekSai",
-        "RekSai": "RekSai",
-        "Tahm Kench": "TahmKench",
-        "Twisted Fate": "TwistedFate",
-        "Vel'Koz": "Velkoz",
-        "VelKoz": "Velkoz",
-        "Xin Zhao": "XinZhao",
-    }
-
     # Check special cases first
-    if name in special_cases:
-        return special_cases[name]
+    if name in _SPECIAL_CASES:
+        return _SPECIAL_CASES[name]
 
     # Remove spaces, apostrophes, and periods
-    normalized = name.replace(" ", "").replace("'", "").replace(".", "")
+    return name.translate(_STRIP_TABLE)
 
-    return normalized
+
+def _winrate_pct(wins: int, games: int) -> float:
+    """Winrate as a percentage rounded to one decimal; 0 when nothing was played."""
+    return round(wins / games * 100, 1) if games > 0 else 0
 
 
 def _get_randomness_level(randomness: Dict[str, Any]) -> str:
@@ -117,39 +156,8 @@ def _get_draft_priority(plan: Dict[str, Any], randomness: Dict[str, Any]) -> str
     return "comfort"
 
 
-def _extract_players_from_report(report: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract unique players from per_player data."""
-    per_player = report.get("per_player", {})
-    players = []
-    seen_ids = set()
-
-    for player_id, player_data in per_player.items():
-        if player_id in seen_ids:
-            continue
-        seen_ids.add(player_id)
-
-        role = _get_role_standard(player_data.get("role"))
-        players.append({
-            "playerId": player_id,
-            "nickname": player_data.get("name", player_id),
-            "role": role,
-        })
-
-    # Sort by role order
-    role_order = {"top": 0, "jungle": 1, "mid": 2, "adc": 3, "support": 4}
-    players.sort(key=lambda p: role_order.get(p["role"], 5))
-
-    return players[:5]  # Limit to 5 players
-
-
-def _extract_stable_picks_by_role(report: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract stable picks grouped by role."""
-    per_player = report.get("per_player", {})
-
-    # Get stable champions data which has actual game stats
-    stable_champions = report.get("insights", {}).get("stable_champions", {}).get("opponent", [])
-
-    # Create a map of champion -> stats
+def _stable_champ_stats(stable_champions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map champion -> game stats from the opponent's stable champions."""
     champ_stats = {}
     for champ_data in stable_champions:
         champ_name = champ_data.get("character")
@@ -159,80 +167,140 @@ def _extract_stable_picks_by_role(report: Dict[str, Any]) -> List[Dict[str, Any]
                 "wins": champ_data.get("wins", 0),
                 "winrate": champ_data.get("winrate", 0) * 100,  # Convert to percentage
             }
+    return champ_stats
 
-    role_picks: Dict[str, List[Dict[str, Any]]] = {
-        "top": [],
-        "jungle": [],
-        "mid": [],
-        "adc": [],
-        "support": [],
-    }
+
+def _aggregate_players(
+    per_player: Dict[str, Any],
+    enhanced_players: Dict[str, Any],
+    stable_champions: List[Dict[str, Any]],
+    total_games: int,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Build the player summaries, stable picks by role and player analysis.
+
+    All three views come from ``per_player``; walking it once resolves each
+    player's role and each comfort pick's stats a single time.
+
+    Args:
+        per_player: Report ``per_player`` section
+        enhanced_players: Report ``enhanced_players`` section
+        stable_champions: Opponent stable champions from ``insights``
+        total_games: Games analyzed, used to estimate games from pick share
+
+    Returns:
+        (players, stable_picks, player_analysis)
+    """
+    # enhanced_players is a dict with player_id as keys
+    if not isinstance(enhanced_players, dict):
+        enhanced_players = {}
+    champ_stats = _stable_champ_stats(stable_champions)
+
+    players = []
+    player_analysis = []
+    add_player = players.append
+    add_analysis = player_analysis.append
+    role_picks: Dict[str, List[Dict[str, Any]]] = {role: [] for role in _ROLE_ORDER}
 
     for player_id, player_data in per_player.items():
         role = _get_role_standard(player_data.get("role"))
-        comfort_picks = player_data.get("comfort_picks", [])
+        nickname = player_data.get("name", player_id)
+        add_player({
+            "playerId": player_id,
+            "nickname": nickname,
+            "role": role,
+        })
 
-        for pick in comfort_picks[:3]:  # Top 3 per player
-            champion = pick.get("character") or pick.get("champion")
+        # Top 5 comfort picks feed the champion pool; the first 3 of those
+        # are also this player's stable picks for the role.
+        champion_pool = []
+        add_pool = champion_pool.append
+        add_stable = role_picks[role].append
+        for idx, pick in enumerate(player_data.get("comfort_picks", [])[:5]):
+            pick_get = pick.get
+            champion = pick_get("character") or pick_get("champion")
             if not champion:
                 continue
 
             # Get stats from stable_champions if available
-            stats = champ_stats.get(champion, {})
-            games = stats.get("games", 0)
-            winrate = stats.get("winrate", 0)
+            stats = champ_stats.get(champion)
+            games = stats["games"] if stats else 0
+            winrate = stats["winrate"] if stats else 0
 
             # Fallback: estimate from pick share if no stable data
+            share = pick_get("share", 0)
             if games == 0:
-                total_games = report.get("opponent_overview", {}).get("games", 1)
-                games = int(pick.get("share", 0) * total_games)
+                games = int(share * total_games)
                 winrate = 50.0  # Unknown, use neutral
 
-            # Simple KDA estimate (we don't have per-champion KDA)
-            kda = 2.5  # Placeholder since we don't have per-champion KDA data
-
-            role_picks[role].append({
-                "championId": _normalize_champion_name(champion),
-                "role": role,
+            champion_id = _normalize_champion_name(champion)
+            add_pool({
+                "championId": champion_id,
                 "gamesPlayed": games,
                 "winrate": round(winrate, 1),
-                "kda": kda,
-                "isSignaturePick": pick.get("share", 0) >= 0.25,
+                "isComfort": share >= 0.2,
             })
+            if idx < 3:
+                add_stable({
+                    "championId": champion_id,
+                    "role": role,
+                    "gamesPlayed": games,
+                    "winrate": round(winrate, 1),
+                    "kda": 2.5,  # Placeholder since we don't have per-champion KDA data
+                    "isSignaturePick": share >= 0.25,
+                })
+
+        enhanced = enhanced_players.get(player_id, {})
+        tendencies = {
+            "earlyGameAggression": enhanced.get("early_aggression", 0.5),
+            "teamfightParticipation": enhanced.get("teamfight_participation", 0.7),
+            "soloKillRate": enhanced.get("solo_kill_rate", 0.3),
+            "visionScore": enhanced.get("vision_score", 0.5),
+        }
 
-    # Build result grouped by role
-    result = []
-    for role in ["top", "jungle", "mid", "adc", "support"]:
-        picks = role_picks[role]
-        # Sort by games played and limit to 3
-        picks.sort(key=lambda p: p["gamesPlayed"], reverse=True)
+        add_analysis({
+            "playerId": player_id,
+            "nickname": nickname,
+            "role": role,
+            # Volatility is already a 0-1 normalized value
+            "entropy": round(player_data.get("volatility", 0.5), 2),
+            "championPool": champion_pool,
+            "tendencies": tendencies,
+        })
+
+    # Sort by role order
+    players.sort(key=_role_sort_key)
+    player_analysis.sort(key=_role_sort_key)
+
+    # Stable picks grouped by role, most played first, 3 per role
+    stable_picks = []
+    for role, picks in role_picks.items():
         if picks:
-            result.append({
+            stable_picks.append({
                 "role": role,
-                "picks": picks[:3],
+                "picks": nlargest(3, picks, key=_GAMES_KEY),
             })
 
-    return result
+    return players[:5], stable_picks, player_analysis
 
 
-def _extract_draft_tendencies(report: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract draft tendencies from report."""
-    draft = report.get("draft_tendencies", {})
-    priority_picks = draft.get("priority_picks", [])
+def _extract_draft_tendencies(priority_picks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Extract draft tendencies from the report's priority picks."""
 
     tendencies = []
+    append = tendencies.append
     for i, pick in enumerate(priority_picks[:10]):
-        champion = pick.get("character") or pick.get("champion")
+        pick_get = pick.get
+        champion = pick_get("character") or pick_get("champion")
         if not champion:
             continue
 
         # Priority picks have "share" which is already the pick rate as a decimal (0.0 to 1.0)
-        pick_rate = pick.get("share", 0) * 100  # Convert to percentage
+        pick_rate = pick_get("share", 0) * 100  # Convert to percentage
 
         # Ban rate - currently not tracked in scouting data
-        ban_rate = pick.get("ban_rate", 0)
+        ban_rate = pick_get("ban_rate", 0)
 
-        tendencies.append({
+        append({
             "championId": _normalize_champion_name(champion),
             "pickRate": round(pick_rate, 1),
             "banRate": round(ban_rate, 1),
@@ -242,30 +310,58 @@ def _extract_draft_tendencies(report: Dict[str, Any]) -> Dict[str, Any]:
     return {"priorityPicks": tendencies}
 
 
-def _extract_scenarios(report: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract scenario cards from report."""
-    scenarios = report.get("scenarios", [])
-    enhanced_scenarios = report.get("enhanced_scenarios", [])
+def _unique_scenarios(scenarios: List[Dict[str, Any]]) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Yield (scenario_id, scenario) pairs, skipping repeated ids.
 
-    result = []
+    Scenarios without an id fall back to their position in the list.
+    """
     seen_ids = set()
-
-    for i, scenario in enumerate(scenarios[:5]):
+    for i, scenario in enumerate(scenarios):
         scenario_id = scenario.get("scenario_id", i)
+        if scenario_id not in seen_ids:
+            seen_ids.add(scenario_id)
+            yield scenario_id, scenario
+
+
+def _scenario_display_name(
+    scenario_id: Any,
+    name: str | None,
+    volatility: float,
+    share_pct: float,
+    winrate_pct: float,
+) -> str:
+    """Readable scenario name, derived from its stats when none was given."""
+    if name and name != f"Scenario {scenario_id}":
+        return name
+    if volatility > 0.7:
+        return "Chaos Flex"
+    if share_pct > 40:
+        return "Primary Style"
+    if winrate_pct > 60:
+        return "High Win Comp"
+    return f"Style {scenario_id + 1}"
+
+
+def _extract_scenarios(
+    scenarios: List[Dict[str, Any]],
+    enhanced_scenarios: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Extract scenario cards from report."""
 
-        # Skip if we've already processed this scenario ID (deduplication)
-        if scenario_id in seen_ids:
-            continue
-        seen_ids.add(scenario_id)
+    # First entry wins on duplicate ids, matching a linear search
+    enhanced_by_id: Dict[Any, Dict[str, Any]] = {}
+    for s in enhanced_scenarios:
+        enhanced_by_id.setdefault(s.get("scenario_id"), s)
+
+    result = []
+    append = result.append
 
+    for scenario_id, scenario in islice(_unique_scenarios(scenarios), 5):
         share = scenario.get("share", 0) * 100  # Convert to percentage
         winrate = scenario.get("winrate", 0) * 100
 
         # Get enhanced data if available
-        enhanced = next(
-            (s for s in enhanced_scenarios if s.get("scenario_id") == scenario_id),
-            {}
-        )
+        enhanced = enhanced_by_id.get(scenario_id, {})
 
         # Extract signature picks for stats
         sig_picks = scenario.get("signature_picks", {})
@@ -279,29 +375,18 @@ def _extract_scenarios(report: Dict[str, Any]) -> List[Dict[str, Any]]:
         if sig_picks:
             # Normalize champion names for images
             targets = [_normalize_champion_name(champ) for champ in list(sig_picks.values())[:2]]
-        if "pick" in punish_plan.lower():
+        plan_lower = punish_plan.lower()
+        if "pick" in plan_lower:
             action = "pick"
-        elif "counter" in punish_plan.lower():
+        elif "counter" in plan_lower:
             action = "counter"
-        elif "play" in punish_plan.lower() or "style" in punish_plan.lower():
+        elif "play" in plan_lower or "style" in plan_lower:
             action = "playstyle"
             targets = []
 
-        # Generate a readable name
-        name = enhanced.get("name", f"Scenario {scenario_id}")
-        if not name or name == f"Scenario {scenario_id}":
-            if volatility > 0.7:
-                name = "Chaos Flex"
-            elif share > 40:
-                name = "Primary Style"
-            elif winrate > 60:
-                name = "High Win Comp"
-            else:
-                name = f"Style {scenario_id + 1}"
-
-        result.append({
+        append({
             "scenarioId": str(scenario_id),
-            "name": name,
+            "name": _scenario_display_name(scenario_id, enhanced.get("name"), volatility, share, winrate),
             "description": enhanced.get("description"),
             "likelihood": round(share, 1),
             "winrate": round(winrate, 1),
@@ -321,96 +406,30 @@ def _extract_scenarios(report: Dict[str, Any]) -> List[Dict[str, Any]]:
     return result
 
 
-def _extract_player_analysis(report: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract player analysis from report."""
-    per_player = report.get("per_player", {})
-    enhanced_players = report.get("enhanced_players", {})
-
-    # Get stable champions data for winrate info
-    stable_champions = report.get("insights", {}).get("stable_champions", {}).get("opponent", [])
-    champ_stats = {}
-    for champ_data in stable_champions:
-        champ_name = champ_data.get("character")
-        if champ_name:
-            champ_stats[champ_name] = {
-                "games": champ_data.get("games", 0),
-                "wins": champ_data.get("wins", 0),
-                "winrate": champ_data.get("winrate", 0) * 100,
-            }
-
-    result = []
-    for player_id, player_data in per_player.items():
-        # Get enhanced data if available
-        # enhanced_players is a dict with player_id as keys
-        enhanced = enhanced_players.get(player_id, {}) if isinstance(enhanced_players, dict) else {}
-
-        role = _get_role_standard(player_data.get("role"))
-
-        # Volatility is 0-1, but frontend expects percentage (0-100)
-        # Actually, frontend might expect 0-1 for normalized values. Let's keep it 0-1.
-        entropy = player_data.get("volatility", 0.5)
-
-        # Build champion pool
-        comfort_picks = player_data.get("comfort_picks", [])
-        pick_distribution = player_data.get("pick_distribution", [])
-        total_games = report.get("opponent_overview", {}).get("games", 1)
-
-        champion_pool = []
-        for pick in comfort_picks[:5]:
-            champion = pick.get("character") or pick.get("champion")
-            if not champion:
-                continue
-
-            # Get stats from stable_champions if available
-            stats = champ_stats.get(champion, {})
-            games = stats.get("games", 0)
-            winrate = stats.get("winrate", 0)
-
-            # Fallback: estimate from pick share
-            if games == 0:
-                games = int(pick.get("share", 0) * total_games)
-                # Find winrate from pick_distribution if available
-                dist_entry = next((p for p in pick_distribution if p.get("character") == champion), None)
-                winrate = 50.0  # Unknown, use neutral
-
-            champion_pool.append({
-                "championId": _normalize_champion_name(champion),
-                "gamesPlayed": games,
-                "winrate": round(winrate, 1),
-                "isComfort": pick.get("share", 0) >= 0.2,
-            })
-
-        # Build tendencies
-        tendencies = {
-            "earlyGameAggression": enhanced.get("early_aggression", 0.5),
-            "teamfightParticipation": enhanced.get("teamfight_participation", 0.7),
-            "soloKillRate": enhanced.get("solo_kill_rate", 0.3),
-            "visionScore": enhanced.get("vision_score", 0.5),
-        }
-
-        result.append({
-            "playerId": player_id,
-            "nickname": player_data.get("name", player_id),
-            "role": role,
-            "entropy": round(entropy, 2),  # Keep as 0-1 normalized value
-            "championPool": champion_pool,
-            "tendencies": tendencies,
-        })
-
-    # Sort by role order
-    role_order = {"top": 0, "jungle": 1, "mid": 2, "adc": 3, "support": 4}
-    result.sort(key=lambda p: role_order.get(p["role"], 5))
-
-    return result
-
-
-def _extract_counter_picks(report: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _extract_counter_picks(
+    counters: Dict[str, Any],
+    priority_picks: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
     """Extract counter pick strategies."""
-    counters = report.get("counters", {})
-    draft = report.get("draft_tendencies", {})
-    priority_picks = draft.get("priority_picks", [])
+    role_counters = counters.get("by_role") or {}
+    if not role_counters:
+        return []
+
+    # Index our answers by the enemy pick once, in role/counter order, so each
+    # priority pick is a single lookup instead of a scan of every counter.
+    # Inner dicts act as insertion-ordered sets for dedup.
+    enemy_to_counters: Dict[str, Dict[str, None]] = {}
+    # Each role's data is already the list of counter dicts
+    role_lists = [rd for rd in role_counters.values() if isinstance(rd, list)]
+    for counter_info in chain.from_iterable(role_lists):
+        enemy = counter_info.get("enemy_pick")
+        counter_champ = counter_info.get("our_pick")
+        if not enemy or not counter_champ:
+            continue
+        enemy_to_counters.setdefault(enemy, {})[counter_champ] = None
 
     result = []
+    append = result.append
     seen_targets = set()
 
     # Get top priority picks to suggest counters for
@@ -420,24 +439,11 @@ def _extract_counter_picks(report: Dict[str, Any]) -> List[Dict[str, Any]]:
             continue
         seen_targets.add(target)
 
-        # Find counters for this target
-        role_counters = counters.get("by_role", {})
-        suggested = []
-
-        for role, role_data in role_counters.items():
-            # role_data is already the list of counter dicts
-            if not isinstance(role_data, list):
-                continue
-            for counter_info in role_data:
-                if counter_info.get("enemy_pick") == target:
-                    counter_champ = counter_info.get("our_pick")
-                    if counter_champ and counter_champ not in suggested:
-                        suggested.append(counter_champ)
-
+        suggested = enemy_to_counters.get(target)
         if suggested:
-            result.append({
+            append({
                 "targetChampion": _normalize_champion_name(target),
-                "suggestedCounters": [_normalize_champion_name(c) for c in suggested[:3]],
+                "suggestedCounters": [_normalize_champion_name(c) for c in islice(suggested, 3)],
             })
 
     return result
@@ -456,9 +462,6 @@ def transform_report_to_frontend(
     Returns:
         Frontend-compatible TeamAnalysisReport
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     # Extract key data sections
     try:
         outcomes = raw_report.get("opponent_overview", {})
@@ -467,9 +470,10 @@ def transform_report_to_frontend(
         exec_summary = raw_report.get("executive_summary", {})
         draft_guide = raw_report.get("draft_guide", {})
         report_meta = raw_report.get("meta", {})
-        logger.info("Successfully extracted top-level sections")
+        priority_picks = raw_report.get("draft_tendencies", {}).get("priority_picks", [])
+        logger.debug("Successfully extracted top-level sections")
     except Exception as e:
-        logger.error(f"Error extracting top-level sections: {e}")
+        logger.error("Error extracting top-level sections: %s", e)
         raise
 
     # Calculate statistics
@@ -478,27 +482,35 @@ def transform_report_to_frontend(
     avg_kills = outcomes.get("avg_kills", 0)
     avg_deaths = outcomes.get("avg_deaths", 0)
 
+    # Per-player views (summary, stable picks, analysis) in one pass
+    players, stable_picks, player_analysis = _aggregate_players(
+        raw_report.get("per_player", {}),
+        raw_report.get("enhanced_players", {}),
+        raw_report.get("insights", {}).get("stable_champions", {}).get("opponent", []),
+        outcomes.get("games", 1),
+    )
+
     # Build report info
     try:
-        logger.info("Building report info...")
+        logger.debug("Building report info...")
         report_info = {
             "teamId": report_meta.get("opponent_id", meta.get("opponent", "unknown")),
             "teamName": report_meta.get("opponent_name", meta.get("opponent", "Unknown Team")),
             "gamesAnalyzed": total_games,
-            "opponentWinrate": round((wins / total_games * 100) if total_games > 0 else 0, 1),
+            "opponentWinrate": _winrate_pct(wins, total_games),
             "averageKills": round(avg_kills, 1),
             "averageDeaths": round(avg_deaths, 1),
-            "players": _extract_players_from_report(raw_report),
+            "players": players,
             "timeframe": {
-                "startDate": report_meta.get("window_gte", "")[:10] if report_meta.get("window_gte") else "",
-                "endDate": report_meta.get("window_lte", "")[:10] if report_meta.get("window_lte") else "",
+                "startDate": (report_meta.get("window_gte") or "")[:10],
+                "endDate": (report_meta.get("window_lte") or "")[:10],
                 "patchVersion": None,
             },
-            "generatedAt": datetime.utcnow().isoformat() + "Z",
+            "generatedAt": _now_iso(),
         }
-        logger.info("Successfully built report info")
+        logger.debug("Successfully built report info")
     except Exception as e:
-        logger.error(f"Error building report info: {e}")
+        logger.error("Error building report info: %s", e)
         raise
 
     # Build overview
@@ -523,38 +535,36 @@ def transform_report_to_frontend(
 
     # Build draft plan
     try:
-        logger.info("Building draft plan...")
+        logger.debug("Building draft plan...")
         ban_plan = plan.get("ban_plan", [])
         if draft_guide.get("must_ban"):
-            logger.info(f"draft_guide['must_ban'] type: {type(draft_guide['must_ban'])}")
-            logger.info(f"draft_guide['must_ban'] first item type: {type(draft_guide['must_ban'][0]) if draft_guide['must_ban'] else 'empty'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("draft_guide['must_ban'] type: %s", type(draft_guide["must_ban"]))
+                logger.debug("draft_guide['must_ban'] first item type: %s", type(draft_guide["must_ban"][0]))
             must_bans = [b.get("champion") for b in draft_guide["must_ban"] if b.get("champion")]
-            ban_plan = must_bans + [b for b in ban_plan if b not in must_bans]
+            must_ban_set = set(must_bans)
+            ban_plan = must_bans + [b for b in ban_plan if b not in must_ban_set]
 
         draft_plan = {
             "banPlan": [_normalize_champion_name(c) for c in ban_plan[:5] if c],
             "draftPriority": _get_draft_priority(plan, randomness),
-            "counterPicks": _extract_counter_picks(raw_report),
+            "counterPicks": _extract_counter_picks(raw_report.get("counters", {}), priority_picks),
             "strategicNotes": [],
         }
-        logger.info("Successfully built draft plan")
+        logger.debug("Successfully built draft plan")
     except Exception as e:
-        logger.error(f"Error building draft plan: {e}")
+        logger.error("Error building draft plan: %s", e)
         raise
 
     # Build full response
     try:
-        logger.info("Extracting draft tendencies...")
-        draft_tendencies = _extract_draft_tendencies(raw_report)
-        logger.info("Extracting stable picks...")
-        stable_picks = _extract_stable_picks_by_role(raw_report)
-        logger.info("Extracting scenarios...")
-        scenarios = _extract_scenarios(raw_report)
-        logger.info("Extracting player analysis...")
-        player_analysis = _extract_player_analysis(raw_report)
-        logger.info("All extractions complete")
+        logger.debug("Extracting draft tendencies...")
+        draft_tendencies = _extract_draft_tendencies(priority_picks)
+        logger.debug("Extracting scenarios...")
+        scenarios = _extract_scenarios(raw_report.get("scenarios", []), raw_report.get("enhanced_scenarios", []))
+        logger.debug("All extractions complete")
     except Exception as e:
-        logger.error(f"Error in final extraction phase: {e}")
+        logger.error("Error in final extraction phase: %s", e)
         raise
 
     return {
@@ -6,6 +6,7 @@ import logging
 from typing import Any, Dict
 
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,11 @@ from ...infrastructure.adapters.grid_scouting_adapter import (
 )
 
 
+async def _send_json(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """Send a JSON text frame, encoded by pydantic-core instead of json.dumps."""
+    await websocket.send_text(to_json(payload).decode())
+
+
 class WebSocketProgressCallback(ProgressCallbackPort):
     """Progress callback that sends updates via WebSocket."""
 
@@ -31,7 +37,7 @@ class WebSocketProgressCallback(ProgressCallbackPort):
         self, progress: int, message: str, status: str = "processing"
     ) -> None:
         """Send progress update via WebSocket."""
-        await self._websocket.send_json({
+        await _send_json(self._websocket, {
             "status": status,
             "progress": progress,
             "message": message,
@@ -100,7 +106,7 @@ async def handle_report_websocket(websocket: WebSocket) -> None:
 
         # Create adapters
         scouting_adapter = GridScoutingAdapter()
-        report_builder = GridReportBuilderAdapter(scouting_adapter)
+        report_builder = GridReportBuilderAdapter()
 
         # Execute use case with progress tracking
         use_case = GenerateReportUseCase(scouting_adapter, report_builder)
@@ -125,16 +131,18 @@ async def handle_report_websocket(websocket: WebSocket) -> None:
         # Transform to frontend format
         try:
             # Debug: Log report structure
-            logger.info(f"Report keys: {list(result.report.keys()) if result.report else 'None'}")
-            if result.report and "per_player" in result.report:
-                logger.info(f"per_player type: {type(result.report['per_player'])}")
-                if isinstance(result.report["per_player"], dict):
-                    for pid, pdata in list(result.report["per_player"].items())[:1]:
-                        logger.info(f"Sample player {pid}: comfort_picks type = {type(pdata.get('comfort_picks'))}")
-                        if "comfort_picks" in pdata:
-                            picks = pdata["comfort_picks"]
-                            if picks:
-                                logger.info(f"First comfort pick type: {type(picks[0])}, value: {picks[0]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                report = result.report
+                logger.debug("Report keys: %s", report.keys() if report else None)
+                per_player = report.get("per_player") if report else None
+                if per_player is not None:
+                    logger.debug("per_player type: %s", type(per_player))
+                    if isinstance(per_player, dict) and per_player:
+                        pid, pdata = next(iter(per_player.items()))
+                        picks = pdata.get("comfort_picks")
+                        logger.debug("Sample player %s: comfort_picks type = %s", pid, type(picks))
+                        if picks:
+                            logger.debug("First comfort pick type: %s, value: %s", type(picks[0]), picks[0])
 
             frontend_report = transform_report_to_frontend(
                 result.report,
@@ -142,14 +150,20 @@ async def handle_report_websocket(websocket: WebSocket) -> None:
             )
 
             # Debug: Log transformed report
-            logger.info(f"Transformed report keys: {list(frontend_report.keys())}")
-            logger.info(f"Team: {frontend_report.get('reportInfo', {}).get('teamName')}, Games: {frontend_report.get('reportInfo', {}).get('gamesAnalyzed')}")
-            logger.info(f"Scenarios: {len(frontend_report.get('scenarios', []))}, Players: {len(frontend_report.get('playerAnalysis', []))}")
+            if logger.isEnabledFor(logging.DEBUG):
+                report_info = frontend_report["reportInfo"]
+                logger.debug("Transformed report keys: %s", frontend_report.keys())
+                logger.debug("Team: %s, Games: %s", report_info.get("teamName"), report_info.get("gamesAnalyzed"))
+                logger.debug(
+                    "Scenarios: %d, Players: %d",
+                    len(frontend_report["scenarios"]),
+                    len(frontend_report["playerAnalysis"]),
+                )
 
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
-            logger.error(f"Transform error: {error_details}")
+            logger.error("Transform error: %s", error_details)
             await websocket.send_json({
                 "status": "error",
                 "progress": 0,
@@ -159,7 +173,7 @@ async def handle_report_websocket(websocket: WebSocket) -> None:
             return
 
         # Send completion with report data
-        await websocket.send_json({
+        await _send_json(websocket, {
             "status": "completed",
             "progress": 100,
             "message": "Report ready!",
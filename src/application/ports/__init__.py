@@ -3,15 +3,15 @@
 from .report_builder import ReportBuilderPort
 from .scouting_service import (
     FetchMetadata,
+    GameRecords,
     ProgressCallbackPort,
-    RawGameData,
     ScoutingDataPort,
 )
 
 __all__ = [
     "FetchMetadata",
+    "GameRecords",
     "ProgressCallbackPort",
-    "RawGameData",
     "ReportBuilderPort",
     "ScoutingDataPort",
 ]
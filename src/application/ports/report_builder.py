@@ -1,9 +1,9 @@
 """Port (interface) for building analysis reports."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict
 
-from .scouting_service import FetchMetadata, RawGameData
+from .scouting_service import FetchMetadata, GameRecords
 
 
 class ReportBuilderPort(ABC):
@@ -12,7 +12,7 @@ class ReportBuilderPort(ABC):
     @abstractmethod
     def build_raw_report(
         self,
-        games: List[RawGameData],
+        games: GameRecords,
         meta: FetchMetadata,
     ) -> Dict[str, Any]:
         """Build a raw analysis report from game data.
@@ -20,7 +20,7 @@ class ReportBuilderPort(ABC):
         This returns the internal report format from the scouting module.
 
         Args:
-            games: List of normalized game records
+            games: Normalized game records from the scouting port
             meta: Fetch metadata
 
         Returns:
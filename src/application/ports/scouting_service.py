@@ -2,10 +2,10 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Tuple, Any, Dict
+from typing import Any, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FetchMetadata:
     """Metadata about fetched series data."""
 
@@ -20,17 +20,9 @@ class FetchMetadata:
     series_analyzed: int
 
 
-@dataclass
-class RawGameData:
-    """Raw game data from external source."""
-
-    series_id: str
-    game_number: int
-    start_time: str
-    tournament: Dict[str, Any]
-    team_data: Dict[str, Any]
-    opponent_data: Dict[str, Any]
-    result: str  # "win", "loss", "unknown"
+# Normalized game records from the data source. The report builder consumes
+# them as-is; the application layer only counts them.
+GameRecords = Sequence[Any]
 
 
 class ScoutingDataPort(ABC):
@@ -43,7 +35,8 @@ class ScoutingDataPort(ABC):
         opponent_name: str,
         window_days: int,
         tournament_filter: str | None = None,
-    ) -> Tuple[List[RawGameData], FetchMetadata | None]:
+        timeout_s: float | None = None,
+    ) -> Tuple[GameRecords, FetchMetadata | None]:
         """Fetch matchup data between two teams.
 
         Args:
@@ -51,9 +44,11 @@ class ScoutingDataPort(ABC):
             opponent_name: Opponent team name
             window_days: Days to look back
             tournament_filter: Optional tournament name filter
+            timeout_s: Optional overall time budget; no GRID requests are
+                sent once it has passed
 
         Returns:
-            Tuple of (raw game data list, fetch metadata)
+            Tuple of (normalized game records, fetch metadata)
         """
         ...
 
@@ -1,17 +1,13 @@
 """Use case for generating team analysis reports."""
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
 from dataclasses import dataclass
-from functools import partial
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..ports.scouting_service import ProgressCallbackPort, ScoutingDataPort
 from ..ports.report_builder import ReportBuilderPort
 
-# Thread pool for running blocking I/O operations
-_executor = ThreadPoolExecutor(max_workers=4)
-
 
 @dataclass
 class GenerateReportRequest:
@@ -21,6 +17,12 @@ class GenerateReportRequest:
     opponent_name: str
     window_days: int = 2000
     tournament_filter: str | None = None
+    # Upper bounds for the blocking steps, so a stalled GRID call fails the
+    # request instead of leaving the client waiting indefinitely. The fetch
+    # budget is also passed to the GRID client, which stops sending requests
+    # once it passes, so a timed-out fetch frees its worker thread too
+    fetch_timeout_s: float = 60.0
+    build_timeout_s: float = 120.0
 
 
 @dataclass
@@ -33,6 +35,101 @@ class GenerateReportResult:
     metadata: Dict[str, Any] | None = None
 
 
+# Successful results are reused for identical requests within the TTL, so
+# reconnects and retries skip the GRID fetch and report build. Use cases are
+# created per request, hence module scope.
+_RESULT_TTL_SECONDS = 300.0
+_RESULT_CACHE_SIZE = 128
+
+_ResultKey = Tuple[str, str, int, Optional[str]]
+_result_cache: Dict[_ResultKey, Tuple[float, GenerateReportResult]] = {}
+# Runs currently generating, so identical concurrent requests share one
+_inflight: Dict[_ResultKey, "_Flight"] = {}
+
+
+def _result_key(request: GenerateReportRequest) -> _ResultKey:
+    # GRID team lookup ignores case, so "T1" and "t1 " share a slot
+    return (
+        request.team_name.strip().casefold(),
+        request.opponent_name.strip().casefold(),
+        request.window_days,
+        request.tournament_filter,
+    )
+
+
+def _get_cached_result(key: _ResultKey) -> Optional[GenerateReportResult]:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at < time.monotonic():
+        del _result_cache[key]
+        return None
+    return result
+
+
+def _store_result(key: _ResultKey, result: GenerateReportResult) -> None:
+    _result_cache.pop(key, None)
+    if len(_result_cache) >= _RESULT_CACHE_SIZE:
+        # Oldest insertion goes first
+        del _result_cache[next(iter(_result_cache))]
+    _result_cache[key] = (time.monotonic() + _RESULT_TTL_SECONDS, result)
+
+
+class _ProgressRelay:
+    """Delivers progress updates in order without holding up the caller.
+
+    Each update is sent from a background task that first waits for the
+    previous one, so frames keep their order while the fetch and build steps
+    run. Delivery errors are dropped; they must not fail the report itself.
+    """
+
+    def __init__(self, callback: ProgressCallbackPort | None):
+        self._callback = callback
+        self._last: asyncio.Task | None = None
+
+    def send(self, progress: int, message: str, status: str = "processing") -> None:
+        if self._callback is None:
+            return
+        self._last = asyncio.create_task(self._deliver(self._last, progress, message, status))
+
+    async def _deliver(
+        self, previous: asyncio.Task | None, progress: int, message: str, status: str
+    ) -> None:
+        if previous is not None:
+            await previous
+        try:
+            await self._callback.report_progress(progress, message, status)
+        except Exception:
+            pass
+
+    async def flush(self) -> None:
+        """Wait until every queued update has been delivered."""
+        if self._last is not None:
+            await self._last
+
+
+class _Flight:
+    """A report run that identical concurrent requests can join.
+
+    Progress sent here goes to the leader's relay and to every follower
+    currently attached, so joining clients see the same updates.
+    """
+
+    def __init__(self) -> None:
+        self.future: asyncio.Future[GenerateReportResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.relays: List[_ProgressRelay] = []
+        self.progress = 0
+
+    def send(self, progress: int, message: str, status: str = "processing") -> None:
+        if status == "processing":
+            self.progress = progress
+        for relay in self.relays:
+            relay.send(progress, message, status)
+
+
 class GenerateReportUseCase:
     """Use case for generating team analysis reports.
 
@@ -47,6 +144,12 @@ class GenerateReportUseCase:
         scouting_service: ScoutingDataPort,
         report_builder: ReportBuilderPort,
     ):
+        """Initialize with the data and report ports.
+
+        Args:
+            scouting_service: Source of raw game data
+            report_builder: Builds the analysis report from raw games
+        """
         self._scouting_service = scouting_service
         self._report_builder = report_builder
 
@@ -57,6 +160,10 @@ class GenerateReportUseCase:
     ) -> GenerateReportResult:
         """Execute the report generation use case.
 
+        Recent results are served from the cache, and a request identical to
+        one already running waits for that run, receiving its progress
+        updates, instead of starting its own.
+
         Args:
             request: Report generation request
             progress_callback: Optional callback for progress updates
@@ -64,24 +171,81 @@ class GenerateReportUseCase:
         Returns:
             Report generation result
         """
-        loop = asyncio.get_event_loop()
+        key = _result_key(request)
+        progress = _ProgressRelay(progress_callback)
+        try:
+            cached = _get_cached_result(key)
+            if cached is not None:
+                progress.send(100, "Loaded recent analysis...")
+                return cached
+
+            flight = _inflight.get(key)
+            if flight is not None:
+                progress.send(flight.progress, "Joining an analysis already in progress...")
+            while flight is not None:
+                flight.relays.append(progress)
+                try:
+                    # Shielded so a disconnecting follower doesn't cancel the
+                    # run everyone else is waiting on
+                    return await asyncio.shield(flight.future)
+                except asyncio.CancelledError:
+                    if not flight.future.cancelled():
+                        raise
+                finally:
+                    flight.relays.remove(progress)
+                # The run we joined was abandoned; join the next or lead
+                flight = _inflight.get(key)
+
+            return await self._lead(key, request, progress)
+        finally:
+            # Everything sent so far reaches the client before the caller's
+            # completion message
+            await progress.flush()
 
+    async def _lead(
+        self,
+        key: _ResultKey,
+        request: GenerateReportRequest,
+        progress: _ProgressRelay,
+    ) -> GenerateReportResult:
+        """Generate the report while concurrent identical requests wait on it."""
+        flight = _Flight()
+        flight.relays.append(progress)
+        _inflight[key] = flight
+        try:
+            result = await self._generate(request, flight)
+            if result.success:
+                _store_result(key, result)
+            flight.future.set_result(result)
+            return result
+        finally:
+            if not flight.future.done():
+                flight.future.cancel()
+            if _inflight.get(key) is flight:
+                del _inflight[key]
+
+    async def _generate(
+        self,
+        request: GenerateReportRequest,
+        progress: _Flight,
+    ) -> GenerateReportResult:
+        """Fetch the games and build the report."""
         try:
             # Step 1: Fetch data (run in thread to not block event loop)
-            if progress_callback:
-                await progress_callback.report_progress(
-                    10, "Connecting to data sources...", "processing"
-                )
+            progress.send(10, "Connecting to data sources...")
 
-            # Run blocking I/O in thread pool
-            fetch_func = partial(
-                self._scouting_service.fetch_matchup_data,
-                team_name=request.team_name,
-                opponent_name=request.opponent_name,
-                window_days=request.window_days,
-                tournament_filter=request.tournament_filter,
+            # Run blocking I/O in a worker thread
+            games, meta = await asyncio.wait_for(
+                asyncio.to_thread(
+                    self._scouting_service.fetch_matchup_data,
+                    team_name=request.team_name,
+                    opponent_name=request.opponent_name,
+                    window_days=request.window_days,
+                    tournament_filter=request.tournament_filter,
+                    timeout_s=request.fetch_timeout_s,
+                ),
+                timeout=request.fetch_timeout_s,
             )
-            games, meta = await loop.run_in_executor(_executor, fetch_func)
 
             if not games:
                 return GenerateReportResult(
@@ -95,28 +259,21 @@ class GenerateReportUseCase:
                     error="Failed to retrieve match metadata.",
                 )
 
-            if progress_callback:
-                await progress_callback.report_progress(
-                    25, f"Found {len(games)} games to analyze...", "processing"
-                )
+            progress.send(25, f"Found {len(games)} games to analyze...")
 
             # Step 2: Build report (run in thread to not block event loop)
-            if progress_callback:
-                await progress_callback.report_progress(
-                    45, "Analyzing draft patterns...", "processing"
-                )
+            progress.send(45, "Analyzing draft patterns...")
 
-            build_func = partial(
-                self._report_builder.build_raw_report,
-                games,
-                meta,
+            report = await asyncio.wait_for(
+                asyncio.to_thread(
+                    self._report_builder.build_raw_report,
+                    games,
+                    meta,
+                ),
+                timeout=request.build_timeout_s,
             )
-            report = await loop.run_in_executor(_executor, build_func)
 
-            if progress_callback:
-                await progress_callback.report_progress(
-                    65, "Processing player statistics...", "processing"
-                )
+            progress.send(65, "Processing player statistics...")
 
             if not report:
                 return GenerateReportResult(
@@ -124,10 +281,7 @@ class GenerateReportUseCase:
                     error="Failed to build analysis report.",
                 )
 
-            if progress_callback:
-                await progress_callback.report_progress(
-                    80, "Generating insights...", "processing"
-                )
+            progress.send(80, "Generating insights...")
 
             # Step 3: Prepare metadata
             metadata = {
@@ -138,10 +292,7 @@ class GenerateReportUseCase:
                 "games_analyzed": len(games),
             }
 
-            if progress_callback:
-                await progress_callback.report_progress(
-                    90, "Finalizing report...", "processing"
-                )
+            progress.send(90, "Finalizing report...")
 
             return GenerateReportResult(
                 success=True,
@@ -149,11 +300,15 @@ class GenerateReportUseCase:
                 metadata=metadata,
             )
 
+        except asyncio.TimeoutError:
+            message = "Report generation timed out; the data source may be slow, please retry."
+            progress.send(0, f"Error: {message}", "error")
+            return GenerateReportResult(
+                success=False,
+                error=message,
+            )
         except Exception as e:
-            if progress_callback:
-                await progress_callback.report_progress(
-                    0, f"Error: {str(e)}", "error"
-                )
+            progress.send(0, f"Error: {str(e)}", "error")
             return GenerateReportResult(
                 success=False,
                 error=str(e),
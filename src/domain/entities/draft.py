@@ -1,30 +1,30 @@
 """Draft-related domain entities."""
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 
 from ..value_objects.types import ChampionId, DraftPriority, Percentage, Role
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CounterPickStrategy:
     """Counter pick recommendation."""
 
     target_champion: ChampionId
-    suggested_counters: List[ChampionId]
+    suggested_counters: Tuple[ChampionId, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DraftPlan:
     """Strategic draft recommendations."""
 
-    ban_plan: List[ChampionId]
+    ban_plan: Tuple[ChampionId, ...]
     draft_priority: DraftPriority
-    counter_picks: List[CounterPickStrategy] = field(default_factory=list)
-    strategic_notes: List[str] = field(default_factory=list)
+    counter_picks: Tuple[CounterPickStrategy, ...] = ()
+    strategic_notes: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChampionPriority:
     """Champion draft priority statistics."""
 
@@ -34,14 +34,14 @@ class ChampionPriority:
     priority: int  # 1 = highest priority
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DraftTendencies:
     """Team draft tendencies."""
 
-    priority_picks: List[ChampionPriority]
+    priority_picks: Tuple[ChampionPriority, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StablePick:
     """Stable/consistent champion pick."""
 
@@ -53,9 +53,9 @@ class StablePick:
     is_signature_pick: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StablePicksByRole:
     """Stable picks grouped by role."""
 
     role: Role
-    picks: List[StablePick]
+    picks: Tuple[StablePick, ...]
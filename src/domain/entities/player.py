@@ -1,7 +1,7 @@
 """Player domain entity."""
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 
 from ..value_objects.types import (
     ChampionId,
@@ -12,7 +12,7 @@ from ..value_objects.types import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChampionPoolEntry:
     """Champion in a player's pool."""
 
@@ -22,7 +22,7 @@ class ChampionPoolEntry:
     is_comfort: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerTendencies:
     """Statistical tendencies for a player."""
 
@@ -32,7 +32,7 @@ class PlayerTendencies:
     vision_score: NormalizedValue
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerSummary:
     """Brief player information."""
 
@@ -41,7 +41,7 @@ class PlayerSummary:
     role: Role
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerAnalysis:
     """Comprehensive player analysis."""
 
@@ -49,5 +49,5 @@ class PlayerAnalysis:
     nickname: str
     role: Role
     entropy: NormalizedValue  # 0-1, higher = wider pool / less predictable
-    champion_pool: List[ChampionPoolEntry] = field(default_factory=list)
+    champion_pool: Tuple[ChampionPoolEntry, ...] = ()
     tendencies: PlayerTendencies | None = None
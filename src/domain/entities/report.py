@@ -1,7 +1,7 @@
 """Report domain entity - the main aggregate."""
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 
 from ..value_objects.types import (
     NormalizedValue,
@@ -15,7 +15,7 @@ from .player import PlayerAnalysis, PlayerSummary
 from .scenario import ScenarioCard
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportInfo:
     """Report metadata."""
 
@@ -25,21 +25,21 @@ class ReportInfo:
     opponent_winrate: Percentage
     average_kills: float
     average_deaths: float
-    players: List[PlayerSummary]
+    players: Tuple[PlayerSummary, ...]
     timeframe: Timeframe
     generated_at: str  # ISO 8601 timestamp
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OverviewAnalysis:
     """High-level overview of opponent."""
 
     randomness: RandomnessLevel
     randomness_score: NormalizedValue  # 0-1, higher = more chaotic
-    strategic_insights: List[str]
+    strategic_insights: Tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TeamAnalysisReport:
     """Complete team analysis report - main domain aggregate."""
 
@@ -47,6 +47,6 @@ class TeamAnalysisReport:
     overview: OverviewAnalysis
     draft_plan: DraftPlan
     draft_tendencies: DraftTendencies
-    stable_picks: List[StablePicksByRole]
-    scenarios: List[ScenarioCard]
-    player_analysis: List[PlayerAnalysis]
+    stable_picks: Tuple[StablePicksByRole, ...]
+    scenarios: Tuple[ScenarioCard, ...]
+    player_analysis: Tuple[PlayerAnalysis, ...]
@@ -1,12 +1,12 @@
 """Scenario/playstyle domain entities."""
 
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Tuple
 
 from ..value_objects.types import ChampionId, NormalizedValue, Percentage, PunishAction
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioStats:
     """Statistics describing a scenario/playstyle."""
 
@@ -16,16 +16,16 @@ class ScenarioStats:
     macro: NormalizedValue
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PunishStrategy:
     """Strategy to punish/counter a scenario."""
 
     action: PunishAction
-    targets: List[ChampionId]
+    targets: Tuple[ChampionId, ...]
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioCard:
     """Game scenario/playstyle cluster."""
 
@@ -1,7 +1,7 @@
 """Domain value objects and type aliases."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import NewType
 
 # Type aliases for domain clarity
@@ -12,7 +12,7 @@ Percentage = NewType("Percentage", float)  # 0-100
 NormalizedValue = NewType("NormalizedValue", float)  # 0-1
 
 
-class Role(str, Enum):
+class Role(StrEnum):
     """Player role/position in game."""
 
     TOP = "top"
@@ -22,7 +22,7 @@ class Role(str, Enum):
     SUPPORT = "support"
 
 
-class RandomnessLevel(str, Enum):
+class RandomnessLevel(StrEnum):
     """Team unpredictability classification."""
 
     PREDICTABLE = "predictable"
@@ -30,7 +30,7 @@ class RandomnessLevel(str, Enum):
     CHAOTIC = "chaotic"
 
 
-class DraftPriority(str, Enum):
+class DraftPriority(StrEnum):
     """Draft strategy priority."""
 
     FLEXIBILITY = "flexibility"
@@ -39,7 +39,7 @@ class DraftPriority(str, Enum):
     EARLY_POWER = "early_power"
 
 
-class PunishAction(str, Enum):
+class PunishAction(StrEnum):
     """Action type for punish strategy."""
 
     BAN = "ban"
@@ -48,7 +48,7 @@ class PunishAction(str, Enum):
     PLAYSTYLE = "playstyle"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Timeframe:
     """Analysis timeframe value object."""
 
@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
 # Load environment variables
@@ -49,6 +50,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reports are large, repetitive JSON; compress REST responses over 1 KB.
+# WebSocket frames are compressed by uvicorn's permessage-deflate, which is
+# on by default (--ws-per-message-deflate).
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
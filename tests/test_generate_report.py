@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.application.use_cases import generate_report
+from src.application.use_cases.generate_report import (
+    GenerateReportRequest,
+    GenerateReportUseCase,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    generate_report._result_cache.clear()
+    yield
+    generate_report._result_cache.clear()
+
+
+class _SlowScouting:
+    def __init__(self, delay_s: float = 0.05):
+        self.delay_s = delay_s
+        self.calls = 0
+        self.started = threading.Event()
+
+    def fetch_matchup_data(self, **kwargs):
+        self.calls += 1
+        self.started.set()
+        time.sleep(self.delay_s)
+        return ["game"], "meta"
+
+
+class _Builder:
+    def build_raw_report(self, games, meta):
+        return {"games": len(games)}
+
+
+class _Recorder:
+    def __init__(self):
+        self.updates = []
+
+    async def report_progress(self, progress, message, status="processing"):
+        self.updates.append((progress, message, status))
+
+
+def _request(**kwargs) -> GenerateReportRequest:
+    return GenerateReportRequest(team_name="Cloud9", opponent_name="T1", **kwargs)
+
+
+def test_concurrent_identical_requests_fetch_once() -> None:
+    scouting = _SlowScouting()
+
+    async def run():
+        use_case = GenerateReportUseCase(scouting, _Builder())
+        return await asyncio.gather(*(use_case.execute(_request()) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert scouting.calls == 1
+    assert all(r.success and r.report == {"games": 1} for r in results)
+    assert generate_report._inflight == {}
+
+
+def test_follower_takes_over_when_leader_is_cancelled() -> None:
+    scouting = _SlowScouting(delay_s=0.1)
+
+    async def run():
+        use_case = GenerateReportUseCase(scouting, _Builder())
+        leader = asyncio.create_task(use_case.execute(_request()))
+        await asyncio.to_thread(scouting.started.wait)
+        follower = asyncio.create_task(use_case.execute(_request()))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    result = asyncio.run(run())
+    assert result.success
+    assert scouting.calls == 2
+    assert generate_report._inflight == {}
+
+
+def test_timeout_clears_inflight_run() -> None:
+    scouting = _SlowScouting(delay_s=0.2)
+
+    async def run():
+        use_case = GenerateReportUseCase(scouting, _Builder())
+        return await use_case.execute(_request(fetch_timeout_s=0.01))
+
+    result = asyncio.run(run())
+    assert not result.success
+    assert "timed out" in result.error
+    assert generate_report._inflight == {}
+    assert generate_report._result_cache == {}
+
+
+def test_follower_receives_leader_progress() -> None:
+    scouting = _SlowScouting()
+    leader_progress, follower_progress = _Recorder(), _Recorder()
+
+    async def run():
+        use_case = GenerateReportUseCase(scouting, _Builder())
+        leader = asyncio.create_task(use_case.execute(_request(), leader_progress))
+        await asyncio.to_thread(scouting.started.wait)
+        await use_case.execute(_request(), follower_progress)
+        await leader
+
+    asyncio.run(run())
+    assert scouting.calls == 1
+    assert follower_progress.updates[0] == (10, "Joining an analysis already in progress...", "processing")
+    follower_messages = [u[1] for u in follower_progress.updates]
+    assert follower_messages[1:] == [u[1] for u in leader_progress.updates[1:]]
+    assert follower_messages[-1] == "Finalizing report..."
@@ -0,0 +1,21 @@
+import time
+
+import pytest
+
+from scouting.config import CacheConfig
+from scouting.grid_client import GridGraphQLClient
+
+
+def test_query_stops_once_deadline_has_passed(tmp_path) -> None:
+    client = GridGraphQLClient(
+        "key",
+        cache=CacheConfig(enabled=False, base_dir=tmp_path),
+        deadline=time.monotonic() - 1.0,
+    )
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("no request should be sent after the deadline")
+
+    client.session.post = fail_post
+    with pytest.raises(TimeoutError):
+        client.query("https://example.invalid/graphql", "{ titles { id } }")
@@ -0,0 +1,88 @@
+from scouting.frame import build_opponent_frame
+from scouting.insights_enhanced import (
+    build_pick_responses,
+    generate_kill_participation_web,
+    generate_pick_decision_tree,
+)
+from scouting.normalize import GameRecord, TeamGameState, PlayerPerf
+
+
+def _game(opp_win: bool, their_champ: str, our_champ: str) -> GameRecord:
+    team = TeamGameState(
+        team_id="teamA",
+        won=not opp_win,
+        score=0 if opp_win else 1,
+        kills=5,
+        deaths=10,
+        players=[
+            PlayerPerf(player_id="a1", name="Ours", role="top", character=our_champ, kills=1, deaths=3),
+        ],
+    )
+    opp = TeamGameState(
+        team_id="teamB",
+        won=opp_win,
+        score=1 if opp_win else 0,
+        kills=10,
+        deaths=5,
+        players=[
+            PlayerPerf(player_id="b1", name="Top", role="top", character=their_champ, kills=3, deaths=1),
+            PlayerPerf(player_id="b2", name="Jungle", role="jg", character="Vi", kills=5, deaths=2),
+        ],
+    )
+    return GameRecord(
+        series_id="s",
+        game_number=1,
+        start_time="2025-12-01T12:00:00Z",
+        tournament={},
+        team=team,
+        opponent=opp,
+        result="loss" if opp_win else "win",
+    )
+
+
+def test_pick_responses_count_picks_and_answers() -> None:
+    games = [_game(True, "Ornn", "Gnar"), _game(False, "Ornn", "Gnar"), _game(False, "Ornn", "Jax")]
+    counts = build_pick_responses(build_opponent_frame(games))
+    assert counts.pick_games[(0, "Ornn")] == 3
+    assert counts.pick_wins[(0, "Ornn")] == 1
+    assert counts.response_games[(0, "Ornn", "Gnar")] == 2
+    assert counts.response_wins[(0, "Ornn", "Gnar")] == 1
+
+
+def test_pick_decision_tree_quick_reference() -> None:
+    games = [_game(True, "Ornn", "Gnar"), _game(True, "Ornn", "Gnar"), _game(False, "Ornn", "Jax")]
+    tree = generate_pick_decision_tree(games, {}, {})
+    top = next(r for r in tree["quick_reference"] if r["role"] == "top")
+    matchup = top["matchups"][0]
+    assert matchup["if_they_pick"] == "Ornn"
+    assert matchup["consider"] == "Jax"
+    assert matchup["avoid"] == "Gnar"
+    assert tree["total_nodes"] == len(tree["flowchart"]["nodes"])
+
+
+def test_kill_participation_web_pairs_players() -> None:
+    games = [_game(True, "Ornn", "Gnar") for _ in range(3)]
+    web = generate_kill_participation_web(games, {})
+    assert len(web["network"]["nodes"]) == 2
+    edge = web["network"]["edges"][0]
+    assert (edge["source"], edge["target"]) == ("b1", "b2")
+    assert edge["data"]["games"] == 3
+    assert web["playmaker"]["player_id"] == "b2"
+
+
+def test_kill_participation_web_keeps_encounter_order_for_duo_ties() -> None:
+    def game(players) -> GameRecord:
+        g = _game(True, "Ornn", "Gnar")
+        g.opponent.players = [
+            PlayerPerf(player_id=pid, name=pid, role=role, character="Vi", kills=1, deaths=1)
+            for pid, role in players
+        ]
+        return g
+
+    # Every pair wins all 3 games together; the first pair seen takes the tie
+    roster = [("zjg", "jg"), ("mid", "mid"), ("abot", "bot")]
+    web = generate_kill_participation_web([game(roster) for _ in range(3)], {})
+    edges = [(e["source"], e["target"]) for e in web["network"]["edges"]]
+    assert edges == [("mid", "zjg"), ("abot", "zjg"), ("abot", "mid")]
+    duo = next(i for i in web["insights"] if i["type"] == "duo")
+    assert duo["players"] == ["mid", "zjg"]
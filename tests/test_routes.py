@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.rest import routes
+from src.application.use_cases import generate_report
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    generate_report._result_cache.clear()
+    yield
+    generate_report._result_cache.clear()
+
+
+def test_concurrent_identical_requests_fetch_once(monkeypatch) -> None:
+    calls = []
+
+    class SlowScoutingAdapter:
+        def fetch_matchup_data(self, *args, **kwargs):
+            calls.append(args)
+            time.sleep(0.05)
+            return [], None
+
+    monkeypatch.setattr(routes, "GridScoutingAdapter", SlowScoutingAdapter)
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            body = {"teamName": "Cloud9", "opponentName": "T1"}
+            return await asyncio.gather(
+                *(client.post("/api/analysis/generate", json=body) for _ in range(5))
+            )
+
+    responses = asyncio.run(run())
+    assert [r.status_code for r in responses] == [404] * 5
+    assert len(calls) == 1
+    assert generate_report._inflight == {}